@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from src.main.core.auth.routes import PUBLIC_ROUTE
 from src.main.domains.user import endpoints as user_endpoints
 # 다른 도메인의 엔드포인트들도 여기에 임포트합니다.
 
@@ -7,6 +8,6 @@ api_router = APIRouter()
 api_router.include_router(user_endpoints.router, prefix="/users", tags=["users"])
 # 다른 도메인의 라우터들도 여기에 포함시킵니다.
 
-@api_router.get("/health-check")
+@api_router.get("/health-check", openapi_extra=PUBLIC_ROUTE)
 def health_check():
     return {"status": "ok"}
\ No newline at end of file
@@ -0,0 +1,126 @@
+from fastapi import Request
+from starlette.requests import cookie_parser
+from starlette.types import Scope
+
+from src.main.core.auth.jwt import verify_token
+from src.main.core.exceptions import AuthenticationError
+from src.main.core.tracing import span
+from src.main.db.deps import RequestSession
+from src.main.domains.user.models.user import User
+from src.main.domains.user.repository.token_repository import TokenRepository
+from src.main.domains.user.repository.user_repository import UserRepository
+
+_UNSET = object()
+
+
+class AuthContext:
+    """
+    요청 단위 인증 컨텍스트입니다.
+
+    토큰 검증, 폐기 여부 확인, 유저 조회를 요청당 한 번만 수행하고 결과를 보관하여
+    미들웨어, 의존성 함수, 엔드포인트가 같은 결과를 재사용하도록 합니다.
+    """
+
+    def __init__(self, token: str | None):
+        self.token = token
+        self._payload = _UNSET
+        self._error: AuthenticationError | None = None
+        self._revoked: bool | None = None
+        self._user = _UNSET
+
+    def get_payload(self) -> dict:
+        """검증된 토큰 페이로드를 반환합니다. 검증 실패 시 AuthenticationError를 발생시킵니다."""
+        if self._payload is _UNSET:
+            if not self.token:
+                self._error = AuthenticationError("제공된 토큰이 없습니다.")
+                self._payload = None
+            else:
+                try:
+                    with span("auth.verify_token"):
+                        self._payload = verify_token(self.token)
+                except AuthenticationError as e:
+                    self._error = e
+                    self._payload = None
+
+        if self._payload is None:
+            raise self._error
+        return self._payload
+
+    async def is_revoked(self, token_repository: TokenRepository) -> bool:
+        """개별 폐기 또는 유저 토큰 세대 변경으로 무효화된 토큰인지 확인합니다."""
+        if self._revoked is None:
+            payload = self.get_payload()
+            with span("auth.is_revoked"):
+                self._revoked = await token_repository.is_token_revoked(self.token, payload)
+        return self._revoked
+
+    @property
+    def user_loaded(self) -> bool:
+        return self._user is not _UNSET
+
+    async def get_user(self, user_repository: UserRepository) -> User | None:
+        """토큰의 sub(이메일)에 해당하는 유저를 조회합니다. 조회는 요청당 한 번만 실행됩니다."""
+        if self._user is _UNSET:
+            user_email = self.get_payload().get("sub")
+            with span("auth.get_user"):
+                self._user = await user_repository.get_by_email(user_email) if user_email else None
+        return self._user
+
+
+class LazyUser:
+    """
+    request.state.user 로 노출되는 지연 로딩 유저 핸들입니다.
+
+    엔드포인트가 실제로 유저를 읽을 때(`await request.state.user`)에만 DB를 조회하므로,
+    유저 정보가 필요 없는 요청은 DB 커넥션을 사용하지 않습니다. 조회에는 요청 단위 세션을 사용합니다.
+    """
+
+    def __init__(self, context: AuthContext, request_session: RequestSession):
+        self._context = context
+        self._request_session = request_session
+
+    async def resolve(self, user_repository: UserRepository | None = None) -> User | None:
+        """
+        유저를 조회합니다. 토큰이 없거나 유효하지 않으면 None을 반환합니다.
+
+        :param user_repository: 요청에서 이미 사용 중인 저장소. 없으면 요청 단위 세션으로 조회합니다.
+        """
+        if not self._context.token:
+            return None
+
+        try:
+            if user_repository is None and not self._context.user_loaded:
+                user_repository = UserRepository(self._request_session.get())
+            return await self._context.get_user(user_repository)
+        except AuthenticationError:
+            return None
+
+    def __await__(self):
+        return self.resolve().__await__()
+
+
+def extract_token(scope: Scope) -> str | None:
+    """ASGI scope의 원본 헤더에서 access_token 쿠키 또는 Bearer 토큰을 추출합니다."""
+    authorization = None
+    for name, value in scope.get("headers", ()):
+        if name == b"cookie":
+            token = cookie_parser(value.decode("latin-1")).get("access_token")
+            if token:
+                return token
+        elif name == b"authorization":
+            authorization = value.decode("latin-1")
+
+    if authorization:
+        scheme, _, credentials = authorization.partition(" ")
+        if scheme.lower() == "bearer" and credentials:
+            return credentials
+    return None
+
+
+def get_auth_context(request: Request) -> AuthContext:
+    """요청에 연결된 AuthContext를 반환합니다. 없으면 새로 만들어 request.state에 저장합니다."""
+    context = getattr(request.state, "auth", None)
+    if context is None:
+        context = AuthContext(extract_token(request.scope))
+        request.state.auth = context
+    return context
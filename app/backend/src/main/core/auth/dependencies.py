@@ -1,11 +1,10 @@
 from asyncio.log import logger
 from typing import Tuple
 from fastapi import Depends, HTTPException, Request, status
-from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import OAuth2PasswordBearer
 
-from src.main.core.auth.jwt import verify_token
+from src.main.core.auth.context import get_auth_context
 from src.main.core.exceptions import AuthenticationError
 from src.main.domains.user.repository.user_repository import UserRepository
 from src.main.domains.user.dependencies import get_redis_token_manager
@@ -28,24 +27,25 @@ async def get_current_user(
         headers={"WWW-Authenticate":"Bearer"},
     )
 
-    token = request.cookies.get("access_token")
-    if not token:
+    # 미들웨어에서 만든 요청 단위 인증 컨텍스트 재사용
+    auth_context = get_auth_context(request)
+    if not auth_context.token:
         raise AuthenticationError("제공된 토큰이 없습니다.")
 
     try:
-        is_blacklisted = await token_manager.is_token_blacklisted(token)
-        logger.info(f"토큰 블랙리스트 결과 검사: {is_blacklisted}")
-        if is_blacklisted:
-            logger.error("토큰이 블랙리스트에 있습니다.")
+        payload = auth_context.get_payload()
+        if payload.get("sub") is None:
             raise credentials_exception
-        
-        payload = verify_token(token)
-        logger.info(f"토큰 페이로드: {payload}")
-        user_email: str = payload.get("sub")
-        if user_email is None:
+
+        is_revoked = await auth_context.is_revoked(token_manager)
+        logger.debug(f"토큰 폐기 여부 검사: {is_revoked}")
+        if is_revoked:
+            logger.error("폐기된 토큰입니다.")
             raise credentials_exception
-    except JWTError as e:
-        logger.error(f"JWT 에러 발생: {str(e)}")
+    except HTTPException:
+        raise
+    except AuthenticationError as e:
+        logger.error(f"JWT 에러 발생: {e.message}")
         raise credentials_exception
     except Exception as e:
         logger.error(f"토큰 인증 에러 발생: {str(e)}")
@@ -55,18 +55,18 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"}
         )
     
-    user_repository = UserRepository(db)
     try:
-        user = await user_repository.get_by_email(user_email)
-        logger.info(f"유저 검색 결과: {user}")
-        if user is None:
-            logger.error(f"{user_email} 이메일 해당 유저 없음")
-            raise credentials_exception
+        user = await auth_context.get_user(UserRepository(db))
+        logger.debug(f"유저 검색 결과: {user.id if user else None}")
     except Exception as e:
         logger.error(f"유저 검색 에러 발생: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"사용자 정보 조회 중 오류 발생: {str(e)}"
         )
+
+    if user is None:
+        logger.error(f"{payload.get('sub')} 이메일 해당 유저 없음")
+        raise credentials_exception
     
-    return user, token
\ No newline at end of file
+    return user, auth_context.token
@@ -1,10 +1,26 @@
+import hashlib
 from asyncio.log import logger
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 
+from src.main.core.cache import TTLCache
 from src.main.core.exceptions import AuthenticationError
 from src.main.core.config import settings
 
+# 검증이 끝난 토큰 페이로드 캐시 (토큰 만료 시각까지만 유지)
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE)
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+def get_token_expiry(token: str) -> int | None:
+    """서명 검증 없이 exp 클레임만 읽습니다. 폐기 키의 TTL 계산 등 신뢰가 필요 없는 용도로만 사용합니다."""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        return None
+    return exp if isinstance(exp, (int, float)) else None
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     to_encode = data.copy()
     expire = datetime.now() + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
@@ -20,12 +36,20 @@ def create_refresh_token(data: dict, expires_delta: timedelta | None = None):
     return encoded_jwt
 
 def verify_token(token: str):
+    key = token_digest(token)
+    cached = token_cache.get(key)
+    if cached is not None:
+        # 호출자가 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return dict(cached)
+
     try:
-        logger.info(f"토큰 검증 중: {token[:10]}...")
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        logger.info(f"토큰 검증 성공: {payload}")
-        return payload
+        logger.debug(f"토큰 검증 성공: sub={payload.get('sub')}")
     except JWTError as e:
         logger.error(f"토큰 검증 실패: {str(e)}")
         raise AuthenticationError("자격 증명을 검증할 수 없습니다.")
-    
\ No newline at end of file
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(key, payload, expires_at=exp)
+    return dict(payload)
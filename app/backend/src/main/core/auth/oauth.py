@@ -1,5 +1,3 @@
-import logging
-
 from asyncio.log import logger
 from authlib.integrations.starlette_client import OAuth
 from src.main.core.exceptions import InternalServerError
@@ -16,7 +14,7 @@ def setup_oauth():
             name='google',
             client_id=settings.GOOGLE_CLIENT_ID,
             client_secret=settings.GOOGLE_CLIENT_SECRET,
-            server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
+            server_metadata_url=settings.GOOGLE_DISCOVERY_URL,
             client_kwargs={
                 'scope': 'openid email profile',
                 'prompt': 'select_account'
@@ -44,8 +42,6 @@ def setup_oauth():
             client_kwargs={'scope': 'profile_nickname profile_image account_email'}
         )
 
-        logging.getLogger('authlib').setLevel(logging.DEBUG)
-        
     except Exception as e:
         logger.error(f"OAuth 설정 중 오류 발생: {str(e)}")
         raise InternalServerError(f"OAuth 설정 중 오류 발생: {str(e)}")
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import re
+import time
+
+import httpx
+from jose import jwt
+
+logger = logging.getLogger(__name__)
+
+# discovery 문서의 issuer 외에 허용하는 iss 값 (구글은 스킴 없는 iss로도 발급함)
+_ISSUER_ALIASES = {"https://accounts.google.com": ("accounts.google.com",)}
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def cache_max_age(response: httpx.Response, default: int) -> int:
+    """Cache-Control max-age 값(초). 없으면 default를 반환합니다."""
+    match = _MAX_AGE_PATTERN.search(response.headers.get("cache-control", ""))
+    return int(match.group(1)) if match else default
+
+
+class ProviderMetadataCache:
+    """
+    OIDC 제공자의 discovery 문서와 서명 키(JWKS)를 메모리에 보관합니다.
+
+    app_lifespan에서 refresh()로 미리 채우고, run()이 Cache-Control max-age 만료 전에 백그라운드로 갱신합니다.
+    검증과 엔드포인트 조회는 메모리만 읽으므로 로그인 요청이 메타데이터를 직접 가져오는 일은 없습니다.
+    """
+
+    def __init__(
+        self,
+        discovery_url: str,
+        jwks_url: str | None = None,
+        default_ttl: int = 3600,
+        refresh_margin: float = 300,
+        min_refresh_interval: float = 60
+    ):
+        self.discovery_url = discovery_url
+        self.jwks_url = jwks_url
+        self.default_ttl = default_ttl
+        self.refresh_margin = refresh_margin
+        self.min_refresh_interval = min_refresh_interval
+        self.metadata: dict = {}
+        self.jwks: dict | None = None
+        self.expires_at = 0.0
+        self._refreshed_at = 0.0
+        self._refresh_requested = asyncio.Event()
+
+    @property
+    def ready(self) -> bool:
+        return self.jwks is not None
+
+    @property
+    def issuers(self) -> tuple[str, ...]:
+        """id_token의 iss로 허용하는 값. discovery 문서를 받기 전에는 빈 튜플입니다."""
+        issuer = self.metadata.get("issuer")
+        if not issuer:
+            return ()
+        return (issuer, *_ISSUER_ALIASES.get(issuer, ()))
+
+    def endpoint(self, name: str, default: str) -> str:
+        """discovery 문서의 엔드포인트. 아직 받지 못했으면 default(설정값)를 반환합니다."""
+        return self.metadata.get(name) or default
+
+    def request_refresh(self):
+        """키 교체 등으로 검증에 실패했을 때 백그라운드 갱신을 앞당깁니다."""
+        self._refresh_requested.set()
+
+    async def refresh(self, http_client: httpx.AsyncClient):
+        response = await http_client.get(self.discovery_url)
+        response.raise_for_status()
+        metadata = response.json()
+        ttl = cache_max_age(response, self.default_ttl)
+
+        jwks_response = await http_client.get(metadata.get("jwks_uri") or self.jwks_url)
+        jwks_response.raise_for_status()
+        jwks = jwks_response.json()
+        ttl = min(ttl, cache_max_age(jwks_response, self.default_ttl))
+
+        self.metadata = metadata
+        self.jwks = jwks
+        self.expires_at = time.time() + ttl
+        self._refreshed_at = time.time()
+        logger.info(f"OIDC 메타데이터 갱신 완료: {self.discovery_url} (ttl={ttl}s)")
+
+    async def run(self, http_client: httpx.AsyncClient, retry_delay: float = 5.0):
+        """만료 refresh_margin초 전에 갱신을 반복합니다. app_lifespan에서 백그라운드 태스크로 실행합니다."""
+        while True:
+            delay = max(self.expires_at - time.time() - self.refresh_margin, self.min_refresh_interval)
+            if not self.ready:
+                delay = retry_delay
+            try:
+                await asyncio.wait_for(self._refresh_requested.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            self._refresh_requested.clear()
+
+            # 잘못된 토큰이 몰려도 갱신 요청은 min_refresh_interval에 한 번만 보냄
+            wait = self._refreshed_at + self.min_refresh_interval - time.time()
+            if self.ready and wait > 0:
+                await asyncio.sleep(wait)
+
+            try:
+                await self.refresh(http_client)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 기존 키는 만료 후에도 계속 사용하고, 다음 주기에 다시 시도
+                logger.error(f"OIDC 메타데이터 갱신 실패: {self.discovery_url}: {str(e)}")
+
+
+def verify_id_token(
+    id_token: str,
+    jwks: dict,
+    audience: str,
+    issuers: tuple[str, ...],
+    access_token: str | None = None
+) -> dict:
+    """
+    ID 토큰의 서명, aud, iss, exp(및 access_token이 주어지면 at_hash)를 검증하고 클레임을 반환합니다.
+
+    검증 실패 시 jose.JWTError를 발생시킵니다.
+    """
+    return jwt.decode(
+        id_token,
+        jwks,
+        algorithms=["RS256"],
+        audience=audience,
+        issuer=issuers,
+        access_token=access_token,
+    )
@@ -0,0 +1,46 @@
+from fastapi import APIRouter
+from fastapi.routing import APIRoute
+
+# 인증 컨텍스트가 필요 없는 공개 라우트 표시 (OpenAPI 확장 필드로도 노출됨)
+PUBLIC_ROUTE_KEY = "x-auth-public"
+PUBLIC_ROUTE = {PUBLIC_ROUTE_KEY: True}
+
+
+class PublicRouteTable:
+    """
+    공개 라우트 판별 테이블입니다.
+
+    API 접두사 밖의 경로(정적 파일, favicon 등)는 모두 공개로 취급하고,
+    API 경로는 미리 컴파일된 정확 일치 집합과 접두사 튜플로 판별합니다.
+    """
+
+    def __init__(self, api_prefix: str, exact: frozenset[str], prefixes: tuple[str, ...]):
+        self.api_prefix = api_prefix
+        self.exact = exact
+        self.prefixes = prefixes
+
+    def is_public(self, path: str) -> bool:
+        if not path.startswith(self.api_prefix):
+            return True
+        return path in self.exact or path.startswith(self.prefixes)
+
+
+def build_public_route_table(router: APIRouter, api_prefix: str) -> PublicRouteTable:
+    """
+    라우터에 등록된 라우트 중 openapi_extra에 PUBLIC_ROUTE_KEY가 표시된 라우트로 테이블을 만듭니다.
+
+    경로 파라미터가 있는 라우트는 첫 파라미터 앞까지를 접두사로 사용합니다.
+    """
+    exact = set()
+    prefixes = set()
+    for route in router.routes:
+        if not isinstance(route, APIRoute) or not (route.openapi_extra or {}).get(PUBLIC_ROUTE_KEY):
+            continue
+
+        path = f"{api_prefix}{route.path}"
+        if "{" in path:
+            prefixes.add(path[:path.index("{")])
+        else:
+            exact.add(path)
+
+    return PublicRouteTable(api_prefix, frozenset(exact), tuple(sorted(prefixes)))
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import time
+
+from enum import Enum
+from typing import Any, Awaitable, Callable
+
+from src.main.core.exceptions import BaseCustomException, ServiceUnavailableError
+from src.main.core.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    외부 서비스 호출용 서킷 브레이커 + 벌크헤드입니다.
+
+    - 호출마다 timeout초의 데드라인을 적용합니다.
+    - 동시 호출은 max_concurrency개로 제한하고, 초과하면 기다리지 않고 거절합니다.
+    - 연속 failure_threshold번 실패하면 OPEN이 되어 recovery_timeout초 동안 바로 거절하고,
+      이후 한 번의 시험 호출(HALF_OPEN)이 성공하면 다시 CLOSED가 됩니다.
+
+    BaseCustomException(잘못된 code 등 요청 자체의 문제)은 서비스 장애로 보지 않고,
+    ServiceUnavailableError(제공자 5xx, 429 응답 등)만 실패로 집계합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timeout: float,
+        max_concurrency: int,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        latency_histogram: Histogram | None = None
+    ):
+        self.name = name
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        # (name, outcome) 라벨 히스토그램. outcome: success, client_error, timeout, error, cancelled
+        self.latency_histogram = latency_histogram
+        self.state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._in_flight = 0
+        self._trial_in_flight = False
+        self._stats = {
+            "calls": 0,
+            "successes": 0,
+            "failures": 0,
+            "timeouts": 0,
+            "rejections": 0,
+            "latency_total": 0.0,
+            "latency_max": 0.0,
+        }
+
+    def _reject(self, reason: str):
+        self._stats["rejections"] += 1
+        raise ServiceUnavailableError(f"{self.name} 서비스를 일시적으로 사용할 수 없습니다: {reason}")
+
+    def _acquire(self) -> bool:
+        """호출 가능 여부를 확인하고 슬롯을 잡습니다. 시험 호출이면 True를 반환합니다."""
+        trial = False
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self.recovery_timeout:
+                self._reject("circuit open")
+            self.state = CircuitState.HALF_OPEN
+            logger.info(f"서킷 HALF_OPEN 전환: {self.name}")
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._trial_in_flight:
+                self._reject("circuit half-open")
+            self._trial_in_flight = trial = True
+
+        if self._in_flight >= self.max_concurrency:
+            if trial:
+                self._trial_in_flight = False
+            self._reject("too many concurrent calls")
+
+        self._in_flight += 1
+        return trial
+
+    def _record_success(self):
+        self._stats["successes"] += 1
+        self._consecutive_failures = 0
+        if self.state != CircuitState.CLOSED:
+            logger.info(f"서킷 CLOSED 전환: {self.name}")
+        self.state = CircuitState.CLOSED
+
+    def _record_failure(self, trial: bool):
+        self._stats["failures"] += 1
+        self._consecutive_failures += 1
+        if trial or self._consecutive_failures >= self.failure_threshold:
+            if self.state != CircuitState.OPEN:
+                logger.warning(f"서킷 OPEN 전환: {self.name} (연속 실패 {self._consecutive_failures}회)")
+            self.state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+
+    async def call(self, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        trial = self._acquire()
+        self._stats["calls"] += 1
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            async with asyncio.timeout(self.timeout):
+                result = await func(*args, **kwargs)
+        except TimeoutError:
+            outcome = "timeout"
+            self._stats["timeouts"] += 1
+            self._record_failure(trial)
+            raise ServiceUnavailableError(f"{self.name} 응답 시간이 초과되었습니다.")
+        except ServiceUnavailableError:
+            # 제공자 5xx, 429 등 호출 대상이 장애를 알린 경우
+            self._record_failure(trial)
+            raise
+        except BaseCustomException:
+            # 요청 자체의 문제이므로 서비스는 응답한 것으로 봄
+            outcome = "client_error"
+            self._record_success()
+            raise
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except Exception as e:
+            self._record_failure(trial)
+            raise ServiceUnavailableError(f"{self.name} 호출 중 오류가 발생했습니다: {str(e)}") from e
+        else:
+            outcome = "success"
+            self._record_success()
+            return result
+        finally:
+            self._in_flight -= 1
+            if trial:
+                self._trial_in_flight = False
+            latency = time.perf_counter() - started
+            self._stats["latency_total"] += latency
+            self._stats["latency_max"] = max(self._stats["latency_max"], latency)
+            if self.latency_histogram is not None:
+                self.latency_histogram.labels(self.name, outcome).observe(latency)
+
+    def stats(self) -> dict:
+        calls = self._stats["calls"]
+        return {
+            **self._stats,
+            "state": self.state.value,
+            "in_flight": self._in_flight,
+            "latency_avg": self._stats["latency_total"] / calls if calls else 0.0,
+        }
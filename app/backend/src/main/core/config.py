@@ -37,6 +37,43 @@ class Settings(BaseSettings):
     PROJECT_NAME : str
     API_V1_STR: str
     LOG_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)))
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"                # text, json
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_RATE_LIMIT_PER_SECOND: float = 100  # 로거별 INFO 이하 제한 (0이면 제한 없음)
+    LOG_RATE_LIMIT_BURST: int = 200
+    LOG_DEBUG_SAMPLE_RATE: float = 1.0      # DEBUG 레코드 샘플링 비율 (1이면 모두 남김)
+
+    # Metrics
+    METRICS_ENABLED: bool = True
+    METRICS_PATH: str = "/metrics"
+    METRICS_TOKEN: str = ""                     # Authorization: Bearer 값, 비어 있으면 수집 엔드포인트를 등록하지 않음
+
+    # Event loop monitor
+    LOOP_MONITOR_ENABLED: bool = True
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.1
+    LOOP_BLOCK_THRESHOLD_SECONDS: float = 0.1   # 이 시간 이상 루프를 막으면 루프 스레드 스택을 기록
+
+    # Tracing
+    TRACING_ENABLED: bool = True
+    TRACE_EXPORTER: str = "file"                # file, memory
+    TRACE_FILE: str = ""                        # 비어 있으면 LOG_DIR/traces.jsonl
+    TRACE_FILE_MAX_BYTES: int = 100 * 1024 * 1024   # 이 크기를 넘으면 파일 교체
+    TRACE_FILE_BACKUP_COUNT: int = 5
+    TRACE_MEMORY_SIZE: int = 1000
+    TRACE_SLOW_THRESHOLD_SECONDS: float = 0.5   # 이 시간 이상 걸린 요청은 항상 내보냄
+    TRACE_SAMPLE_RATE: float = 0.01             # 나머지 요청의 샘플링 비율
+    TRACE_MAX_SPANS: int = 1000                 # 트레이스 하나에 보관할 최대 스팬 수 (넘치면 개수만 기록)
+
+    # Profiler (꺼져 있으면 미들웨어와 다운로드 라우트를 등록하지 않음)
+    PROFILER_ENABLED: bool = False
+    PROFILER_TOKEN: str = ""                    # X-Profile-Token 헤더 값, 비어 있으면 헤더로 켤 수 없음
+    PROFILER_SAMPLE_RATE: float = 0.0
+    PROFILER_INTERVAL_SECONDS: float = 0.005
+    PROFILER_DIR: str = ""                      # 비어 있으면 LOG_DIR/profiles
+    PROFILER_MAX_CONCURRENT: int = 2
+    PROFILER_MAX_FILES: int = 100
+    PROFILER_PATH: str = "/debug/profiles"
     
     # Server
     BACKEND_CORS_ORIGINS: Annotated[
@@ -46,10 +83,34 @@ class Settings(BaseSettings):
 
     # DB
     SQLALCHEMY_DATABASE_URI: str
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 10.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_VERIFY_SCHEMA: bool = True
+    SQLALCHEMY_REPLICA_URIS: Annotated[list[str] | str, BeforeValidator(parse_cors)] = []
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DB_REPLICA_HEALTH_INTERVAL_SECONDS: float = 5.0
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_PWD: str
 
+    # Cache
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_LOCAL_TTL_SECONDS: int = 5
+    USER_CACHE_MAX_SIZE: int = 10000
+
+    LOGIN_ACTIVITY_QUEUE_SIZE: int = 10000
+    LOGIN_ACTIVITY_BATCH_SIZE: int = 500
+    LOGIN_ACTIVITY_FLUSH_SECONDS: float = 5.0
+    REVOCATION_FILTER_CAPACITY: int = 100000
+    REVOCATION_FILTER_ERROR_RATE: float = 0.001
+    REVOCATION_FILTER_REBUILD_SECONDS: int = 300
+    TOKEN_GENERATION_CACHE_TTL_SECONDS: int = 30
+
     # Oauth2.0
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
@@ -57,6 +118,9 @@ class Settings(BaseSettings):
     GOOGLE_AUTHORIZE_URL: str
     GOOGLE_TOKEN_URL: str
     GOOGLE_USERINFO_URL: str
+    GOOGLE_DISCOVERY_URL: str = "https://accounts.google.com/.well-known/openid-configuration"
+    GOOGLE_JWKS_URL: str = "https://www.googleapis.com/oauth2/v3/certs"
+    OIDC_METADATA_REFRESH_MARGIN_SECONDS: float = 300
 
     NAVER_CLIENT_ID: str
     NAVER_CLIENT_SECRET: str
@@ -72,12 +136,28 @@ class Settings(BaseSettings):
     KAKAO_TOKEN_URL: str
     KAKAO_USERINFO_URL: str
 
+    # 소셜 로그인 제공자 HTTP 클라이언트 (초 단위)
+    OAUTH_HTTP_CONNECT_TIMEOUT: float = 3.0
+    OAUTH_HTTP_READ_TIMEOUT: float = 5.0
+    OAUTH_HTTP_WRITE_TIMEOUT: float = 5.0
+    OAUTH_HTTP_POOL_TIMEOUT: float = 2.0
+    OAUTH_HTTP_MAX_CONNECTIONS: int = 100
+    OAUTH_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    OAUTH_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    OAUTH_HTTP2: bool = False
+    OAUTH_CALL_TIMEOUT_SECONDS: float = 10.0
+    OAUTH_MAX_CONCURRENT_CALLS: int = 50
+    OAUTH_BREAKER_FAILURE_THRESHOLD: int = 5
+    OAUTH_BREAKER_RECOVERY_SECONDS: float = 30.0
+
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     REFRESH_TOKEN_EXPIRE_DAYS: int
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS: int = 10
     OAUTH_STATE_EXPIRE_SECONDS: int
     
     # Token
     SECRET_KEY: str
     ALGORITHM: str
+    TOKEN_CACHE_MAX_SIZE: int = 10000
 
 settings = Settings()
\ No newline at end of file
@@ -20,6 +20,9 @@ class AuthorizationError(BaseCustomException):
 class InternalServerError(BaseCustomException):
     pass
 
+class ServiceUnavailableError(BaseCustomException):
+    pass
+
 # 전역 예외 처리기
 async def custom_exception_handler(request: Request, exc: BaseCustomException):
     if isinstance(exc, NotFoundError):
@@ -30,6 +33,8 @@ async def custom_exception_handler(request: Request, exc: BaseCustomException):
         return JSONResponse(status_code=401, content={"message": exc.message})
     elif isinstance(exc, AuthorizationError):
         return JSONResponse(status_code=403, content={"message": exc.message})
+    elif isinstance(exc, ServiceUnavailableError):
+        return JSONResponse(status_code=503, content={"message": exc.message})
     elif isinstance(exc, InternalServerError):
         return JSONResponse(status_code=500, content={"message": exc.message})
     else:
@@ -1,41 +1,183 @@
+import atexit
+import json
 import logging
-import os
+import queue
+import random
+import re
 import sys
-from logging.handlers import TimedRotatingFileHandler
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 
 from src.main.core.config import settings
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-def setup_logging():
-    log_dir = Path(getattr(settings, 'LOG_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "logs")))
+# 쿠키, 토큰, 인가 코드 등 로그에 남기면 안 되는 값
+_REDACT_PATTERNS = [
+    (re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]+"), "[JWT]"),
+    (re.compile(r"(?i)(bearer\s+)[^\s'\",]+"), r"\1[REDACTED]"),
+    (re.compile(r"(?i)\b((?:access_token|refresh_token|id_token|client_secret)['\"]?\s*[=:]\s*['\"]?)[^\s'\",;&}]+"),
+     r"\1[REDACTED]"),
+    # 인가 코드와 state는 쿼리스트링/폼 본문에서만 가림 ("error code: 500" 같은 일반 문장은 그대로)
+    (re.compile(r"(?i)((?:^|[?&])(?:code|state)=)[^\s'\",;&}]+"), r"\1[REDACTED]"),
+    (re.compile(r"(?i)(['\"]?cookie['\"]?\s*[=:]\s*['\"]?)[^'\"\n]+"), r"\1[REDACTED]"),
+]
+
+
+def redact(message: str) -> str:
+    for pattern, replacement in _REDACT_PATTERNS:
+        message = pattern.sub(replacement, message)
+    return message
+
+
+class RedactingFilter(logging.Filter):
+    """메시지의 쿠키, 토큰 값을 가립니다. 리스너 스레드의 핸들러에 붙여 이벤트 루프 밖에서 실행합니다."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.msg = redact(record.getMessage())
+        record.args = None
+        if record.exc_text:
+            record.exc_text = redact(record.exc_text)
+        return True
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    로거별 토큰 버킷으로 초당 rate건(최대 burst건)까지만 통과시킵니다. WARNING 이상은 제한하지 않습니다.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.suppressed = 0
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(record.name, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+            allowed = tokens >= 1
+            self._buckets[record.name] = (tokens - 1 if allowed else tokens, now)
+            if not allowed:
+                self.suppressed += 1
+        return allowed
+
+
+class DebugSamplingFilter(logging.Filter):
+    """DEBUG 레코드는 sample_rate 비율만 남깁니다."""
+
+    def __init__(self, sample_rate: float):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or random.random() < self.sample_rate
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    이벤트 루프 스레드에서는 레코드를 큐에 넣기만 하는 핸들러입니다.
+
+    메시지 포맷팅, 가림 처리, 파일 쓰기는 QueueListener 스레드에서 하고,
+    큐가 가득 차면 기다리지 않고 버리며 dropped로 집계합니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 인자는 다른 스레드에서 바뀔 수 있으므로 메시지만 확정하고, 예외는 문자열로 바꿔 전달
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: QueueListener | None = None
+
+
+def setup_logging() -> QueueListener:
+    """
+    루트 로거에 큐 기반 핸들러를 설정합니다. 여러 번 호출해도 한 번만 설정됩니다.
+
+    콘솔/파일 핸들러는 QueueListener 스레드에서 실행되므로 로그 파일 롤오버나 디스크 지연이
+    요청 처리에 영향을 주지 않습니다.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_dir = Path(settings.LOG_DIR)
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / "neonadeuli.log"
 
-    # 로그 포맷 설정
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    date_format = "%Y-%m-%d %H:%M:%S"
-
-    # 루트 로거 설정
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
+    if settings.LOG_FORMAT == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
 
     # 콘솔 핸들러
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(logging.Formatter(log_format, date_format))
-    root_logger.addHandler(console_handler)
-    
     # 파일 핸들러 (매일 자정 로그 파일 롤오버)
     file_handler = TimedRotatingFileHandler(
-        log_file, when="midnight", interval=1, backupCount=30
+        log_file, when="midnight", interval=1, backupCount=30, encoding="utf-8"
     )
-    file_handler.setFormatter(logging.Formatter(log_format, date_format))
-    root_logger.addHandler(file_handler)
+    for handler in (console_handler, file_handler):
+        handler.setFormatter(formatter)
+        handler.addFilter(RedactingFilter())
+
+    queue_handler = NonBlockingQueueHandler(queue.Queue(settings.LOG_QUEUE_SIZE))
+    if settings.LOG_DEBUG_SAMPLE_RATE < 1:
+        queue_handler.addFilter(DebugSamplingFilter(settings.LOG_DEBUG_SAMPLE_RATE))
+    if settings.LOG_RATE_LIMIT_PER_SECOND > 0:
+        queue_handler.addFilter(RateLimitFilter(settings.LOG_RATE_LIMIT_PER_SECOND, settings.LOG_RATE_LIMIT_BURST))
+
+    # 루트 로거 설정
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(settings.LOG_LEVEL)
 
     # 특정 모듈의 로그 레벨 설정
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
 
-    return root_logger
+    _listener = QueueListener(queue_handler.queue, console_handler, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
 
-logger = setup_logging()
\ No newline at end of file
+    return _listener
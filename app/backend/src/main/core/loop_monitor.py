@@ -0,0 +1,81 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from src.main.core.config import settings
+from src.main.core.metrics import EVENT_LOOP_BLOCKED_TOTAL, EVENT_LOOP_LAG_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class LoopMonitor:
+    """
+    이벤트 루프 지연 모니터 + 블로킹 호출 감지기입니다.
+
+    - run() 태스크가 interval초마다 깨어나며 예정보다 늦게 깨어난 시간(루프 지연)을 히스토그램에 기록합니다.
+    - 워치독 스레드는 run()의 마지막 틱 이후 interval + threshold초가 지나도록 루프가 돌아오지 않으면
+      블로킹 중으로 보고, 그 순간 이벤트 루프 스레드의 스택을 잡아 경고 로그로 남깁니다.
+      같은 블로킹 구간에서는 한 번만 기록하며, 최근 max_captures개는 captures에 보관합니다.
+    """
+
+    def __init__(self, interval: float, threshold: float, max_captures: int = 20):
+        self.interval = interval
+        self.threshold = threshold
+        self.captures: deque[dict] = deque(maxlen=max_captures)
+        self.max_lag = 0.0
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._stop = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+    def _watch(self):
+        reported_heartbeat = None
+        while not self._stop.wait(self.threshold / 2):
+            heartbeat = self._heartbeat
+            blocked_for = time.monotonic() - heartbeat - self.interval
+            if blocked_for < self.threshold or heartbeat == reported_heartbeat:
+                continue
+            reported_heartbeat = heartbeat
+            self._capture(blocked_for)
+
+    def _capture(self, blocked_for: float):
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        stack = "".join(traceback.format_stack(frame))
+        EVENT_LOOP_BLOCKED_TOTAL.inc()
+        self.captures.append({"time": time.time(), "blocked_seconds": blocked_for, "stack": stack})
+        logger.warning(f"이벤트 루프가 {blocked_for * 1000:.0f}ms 이상 막혀 있습니다. 루프 스레드 스택:\n{stack}")
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(f"이벤트 루프 모니터 시작 (주기 {self.interval}s, 임계값 {self.threshold}s)")
+
+        try:
+            while True:
+                expected = loop.time() + self.interval
+                await asyncio.sleep(self.interval)
+                lag = max(0.0, loop.time() - expected)
+                self._heartbeat = time.monotonic()
+                self.max_lag = max(self.max_lag, lag)
+                EVENT_LOOP_LAG_SECONDS.observe(lag)
+        finally:
+            self._stop.set()
+
+    def stats(self) -> dict:
+        return {"max_lag": self.max_lag, "blocked": len(self.captures)}
+
+
+loop_monitor = LoopMonitor(
+    interval=settings.LOOP_MONITOR_INTERVAL_SECONDS,
+    threshold=settings.LOOP_BLOCK_THRESHOLD_SECONDS,
+)
@@ -0,0 +1,224 @@
+import functools
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Iterable
+
+from src.main.core.tracing import span
+
+# 초 단위 지연 시간 버킷 (1ms ~ 10s)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labelnames: tuple[str, ...], labelvalues: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple, object] = {}
+
+    def labels(self, *labelvalues):
+        """라벨 값별 자식 메트릭. 호출 비용을 줄이려면 모듈/클래스 로드 시점에 미리 받아 두세요."""
+        child = self._children.get(labelvalues)
+        if child is None:
+            if len(labelvalues) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 라벨 {self.labelnames}가 필요합니다.")
+            child = self._children[labelvalues] = self._new_child()
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def _samples(self):
+        for labelvalues, child in list(self._children.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labelvalues)} {child.value}"
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+
+class CallbackGauge(_Metric):
+    """수집 시점에 callback()이 반환하는 {라벨 값 튜플: 값}을 내보내는 게이지입니다."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str], callback: Callable[[], dict]):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def _samples(self):
+        for labelvalues, value in self.callback().items():
+            yield f"{self.name}{_format_labels(self.labelnames, labelvalues)} {float(value)}"
+
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        # 이벤트 루프 스레드에서만 호출되므로 잠금 없이 갱신
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def _samples(self):
+        for labelvalues, child in list(self._children.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), child.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = _format_labels(self.labelnames, labelvalues, f'le="{le}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labelvalues)} {child.sum}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labelvalues)} {cumulative}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 (text/plain; version=0.0.4)"""
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ("route", "method", "status")
+))
+HTTP_REQUESTS_IN_FLIGHT = registry.register(Gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수"
+)).labels()
+REDIS_COMMAND_SECONDS = registry.register(Histogram(
+    "redis_command_duration_seconds", "TokenRepository 메서드별 Redis 처리 시간", ("method",)
+))
+DB_QUERY_SECONDS = registry.register(Histogram(
+    "db_query_duration_seconds", "UserRepository 메서드별 DB 처리 시간", ("method",)
+))
+PROVIDER_CALL_SECONDS = registry.register(Histogram(
+    "oauth_provider_call_duration_seconds", "소셜 로그인 제공자 호출 시간", ("provider", "outcome")
+))
+EVENT_LOOP_LAG_SECONDS = registry.register(Histogram(
+    "event_loop_lag_seconds", "이벤트 루프 지연 (예정보다 늦게 실행된 시간)",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)).labels()
+EVENT_LOOP_BLOCKED_TOTAL = registry.register(Counter(
+    "event_loop_blocked_total", "임계값 이상 이벤트 루프를 막은 호출 수"
+)).labels()
+
+
+def observe_latency(histogram: Histogram, span_prefix: str | None = None):
+    """
+    비동기 메서드의 실행 시간을 메서드 이름 라벨로 기록하는 데코레이터입니다.
+
+    span_prefix를 주면 요청 트레이스에도 "{span_prefix}.{메서드 이름}" 스팬을 남깁니다.
+    """
+
+    def decorator(func):
+        child = histogram.labels(func.__name__)
+        span_name = f"{span_prefix}.{func.__name__}" if span_prefix else None
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                if span_name is None:
+                    return await func(*args, **kwargs)
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def observe_block(child: _HistogramChild, span_name: str | None = None):
+    """
+    with 블록의 실행 시간을 기록합니다.
+
+    로컬 캐시나 Bloom 필터로 답하는 경로가 있는 메서드에서, 실제 I/O 호출만 감싸 측정할 때 사용합니다.
+    """
+    started = time.perf_counter()
+    try:
+        if span_name is None:
+            yield
+        else:
+            with span(span_name):
+                yield
+    finally:
+        child.observe(time.perf_counter() - started)
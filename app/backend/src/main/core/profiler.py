@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import os
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+
+logger = logging.getLogger(__name__)
+
+_PROFILE_ID = re.compile(r"^[\w.-]+$")
+_UNSAFE_CHARS = re.compile(r"[^\w.-]")
+_MAX_AWAIT_DEPTH = 64
+
+
+def _frame_name(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _running_stack(frame: FrameType | None, root_code) -> list[str]:
+    """실행 중인 스레드 스택을 태스크의 최상위 코루틴부터 잘라 대기 스택과 같은 루트로 맞춥니다."""
+    stack = []
+    while frame is not None:
+        stack.append(_frame_name(frame.f_code))
+        if frame.f_code is root_code:
+            break
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _awaiting_stack(task: asyncio.Task) -> list[str]:
+    """대기 중인 태스크의 코루틴 체인(cr_await)을 따라 어디서 기다리는지 스택으로 만듭니다."""
+    stack = []
+    coro = task.get_coro()
+    for _ in range(_MAX_AWAIT_DEPTH):
+        code = getattr(coro, "cr_code", None) or getattr(coro, "gi_code", None)
+        if code is None:
+            if coro is not None:
+                stack.append(type(coro).__name__)
+            break
+        stack.append(_frame_name(code))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+        if coro is None:
+            break
+    stack.append("[await]")
+    return stack
+
+
+class ProfileSession:
+    """
+    요청 하나를 프로파일링하는 통계적 샘플러입니다.
+
+    별도 스레드가 interval초마다 이벤트 루프 스레드를 들여다보고,
+    - 요청 태스크가 실행 중이면 그 스레드의 현재 스택을,
+    - 다른 작업이 실행 중이거나 루프가 쉬는 중이면 요청 태스크가 기다리는 코루틴 체인을
+    collapsed stack(flamegraph.pl, speedscope 형식)으로 집계합니다. 벽시계 기준이라 I/O 대기도 보입니다.
+    """
+
+    def __init__(self, profile_id: str, task: asyncio.Task, interval: float, path: Path, on_finish=None):
+        self.profile_id = profile_id
+        self.task = task
+        self.interval = interval
+        self.path = path
+        self.samples: Counter[str] = Counter()
+        self._loop = task.get_loop()
+        self._root_code = getattr(task.get_coro(), "cr_code", None)
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._on_finish = on_finish
+        self._thread = threading.Thread(target=self._run, name=f"profiler-{profile_id}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        """샘플링을 멈춥니다. 파일 쓰기는 샘플러 스레드가 하므로 이벤트 루프를 막지 않습니다."""
+        self._stop.set()
+
+    def sample(self):
+        if asyncio.current_task(self._loop) is self.task:
+            stack = _running_stack(sys._current_frames().get(self._thread_id), self._root_code)
+        else:
+            stack = _awaiting_stack(self.task)
+        self.samples[";".join(stack)] += 1
+
+    def _run(self):
+        try:
+            while not self._stop.wait(self.interval):
+                try:
+                    self.sample()
+                except Exception:
+                    # 루프 스레드가 스택을 바꾸는 도중에 읽은 경우 등은 해당 샘플만 버림
+                    continue
+            self.write()
+        except Exception as e:
+            logger.warning(f"프로파일 저장 실패: {self.profile_id} ({str(e)})")
+        finally:
+            if self._on_finish is not None:
+                self._on_finish(self)
+
+    def write(self):
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        tmp.replace(self.path)
+
+
+class RequestProfiler:
+    """
+    요청 단위 프로파일 세션을 만들고 결과 파일을 관리합니다.
+
+    동시에 max_concurrent개까지만 프로파일링하고, 디렉터리에는 최근 max_files개의 결과만 남깁니다.
+    결과 파일은 요청이 끝난 뒤 샘플러 스레드가 쓰므로, 그 전까지 해당 id는 is_pending()이 True입니다.
+    """
+
+    def __init__(self, directory: str, interval: float, max_concurrent: int = 2, max_files: int = 100):
+        self.directory = Path(directory)
+        self.interval = interval
+        self.max_concurrent = max_concurrent
+        self.max_files = max_files
+        self._active = 0
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+
+    def start(self, label: str) -> ProfileSession | None:
+        """현재 태스크의 프로파일링을 시작합니다. 동시 세션 수를 넘으면 None을 반환합니다."""
+        with self._lock:
+            if self._active >= self.max_concurrent:
+                return None
+            self._active += 1
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        safe_label = _UNSAFE_CHARS.sub("_", label)[:80]
+        profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{safe_label}-{secrets.token_hex(4)}"
+        session = ProfileSession(
+            profile_id,
+            asyncio.current_task(),
+            self.interval,
+            self.directory / f"{profile_id}.collapsed",
+            on_finish=self._finished,
+        )
+        with self._lock:
+            self._pending.add(profile_id)
+        session.start()
+        return session
+
+    def _finished(self, session: ProfileSession):
+        with self._lock:
+            self._active -= 1
+            self._pending.discard(session.profile_id)
+        self._prune()
+
+    def _prune(self):
+        files = sorted(self.directory.glob("*.collapsed"), key=lambda p: p.stat().st_mtime)
+        for path in files[:max(0, len(files) - self.max_files)]:
+            path.unlink(missing_ok=True)
+
+    def list_profiles(self) -> list[str]:
+        if not self.directory.exists():
+            return []
+        files = sorted(self.directory.glob("*.collapsed"), key=lambda p: p.stat().st_mtime, reverse=True)
+        return [path.stem for path in files]
+
+    def is_pending(self, profile_id: str) -> bool:
+        """프로파일링 중이거나 아직 파일을 쓰지 않은 id인지 반환합니다."""
+        with self._lock:
+            return profile_id in self._pending
+
+    def get_path(self, profile_id: str) -> Path | None:
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        path = self.directory / f"{profile_id}.collapsed"
+        return path if path.is_file() else None
@@ -0,0 +1,267 @@
+import atexit
+import functools
+import json
+import logging
+import os
+import queue
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from logging.handlers import QueueListener, RotatingFileHandler
+from pathlib import Path
+
+import httpx
+from fastapi.responses import JSONResponse
+
+from src.main.core.config import settings
+from src.main.core.logging import NonBlockingQueueHandler
+
+logger = logging.getLogger(__name__)
+
+
+class Span:
+    __slots__ = ("span_id", "parent_id", "name", "start", "duration", "attributes")
+
+    def __init__(self, name: str, parent_id: str | None, start: float, attributes: dict | None = None):
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.start = start
+        self.duration: float | None = None
+        self.attributes = attributes or {}
+
+    def to_dict(self, trace_start: float) -> dict:
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ms": round((self.start - trace_start) * 1000, 3),
+            "duration_ms": round(self.duration * 1000, 3) if self.duration is not None else None,
+            **({"attributes": self.attributes} if self.attributes else {}),
+        }
+
+
+class Trace:
+    """
+    요청 하나의 스팬 목록입니다. TracingMiddleware가 만들어 request.state.trace에 둡니다.
+
+    스팬은 max_spans개까지만 보관하고, 넘친 스팬은 기록하지 않고 dropped_spans로 개수만 셉니다.
+    """
+
+    def __init__(self, name: str, attributes: dict | None = None, max_spans: int | None = None):
+        # 식별용 ID라 암호학적 난수가 필요 없음 (secrets보다 훨씬 빠름)
+        self.trace_id = f"{random.getrandbits(128):032x}"
+        self.started_at = time.time()
+        self.root = Span(name, None, time.perf_counter(), attributes)
+        self.spans: list[Span] = [self.root]
+        self.max_spans = settings.TRACE_MAX_SPANS if max_spans is None else max_spans
+        self.dropped_spans = 0
+
+    @property
+    def duration(self) -> float | None:
+        return self.root.duration
+
+    def add_span(self, span: Span) -> bool:
+        """스팬을 추가합니다. max_spans를 넘으면 추가하지 않고 dropped_spans만 늘린 뒤 False를 반환합니다."""
+        if len(self.spans) >= self.max_spans:
+            self.dropped_spans += 1
+            return False
+        self.spans.append(span)
+        return True
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "started_at": self.started_at,
+            "duration_ms": round(self.root.duration * 1000, 3) if self.root.duration is not None else None,
+            "spans": [span.to_dict(self.root.start) for span in self.spans],
+            "dropped_spans": self.dropped_spans,
+        }
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_trace() -> Trace | None:
+    return _current_trace.get()
+
+
+class span:
+    """
+    현재 요청 트레이스에 자식 스팬을 기록합니다. 트레이스가 없으면(백그라운드 작업 등) 아무것도 하지 않습니다.
+
+        with span("redis.get_refresh_token"):
+            ...
+    """
+
+    __slots__ = ("name", "attributes", "_span", "_token")
+
+    def __init__(self, name: str, **attributes):
+        self.name = name
+        self.attributes = attributes
+        self._span = None
+        self._token = None
+
+    def __enter__(self) -> Span | None:
+        trace = _current_trace.get()
+        if trace is None:
+            return None
+        parent = _current_span.get()
+        self._span = Span(self.name, parent.span_id if parent else trace.root.span_id, time.perf_counter(), self.attributes)
+        if not trace.add_span(self._span):
+            self._span = None
+            return None
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._span is None:
+            return
+        self._span.duration = time.perf_counter() - self._span.start
+        if exc_type is not None:
+            self._span.attributes["error"] = exc_type.__name__
+        _current_span.reset(self._token)
+
+
+def traced(name: str | None = None):
+    """비동기 함수 전체를 스팬으로 기록하는 데코레이터입니다. 이름을 생략하면 함수 이름을 씁니다."""
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(span_name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def start_trace(name: str, attributes: dict | None = None) -> tuple[Trace, tuple]:
+    trace = Trace(name, attributes)
+    tokens = (_current_trace.set(trace), _current_span.set(trace.root))
+    return trace, tokens
+
+
+def finish_trace(trace: Trace, tokens: tuple):
+    trace.root.duration = time.perf_counter() - trace.root.start
+    _current_trace.reset(tokens[0])
+    _current_span.reset(tokens[1])
+
+
+class InMemoryCollector:
+    """최근 maxlen개의 트레이스를 메모리에 보관합니다. (테스트, 디버깅용)"""
+
+    def __init__(self, maxlen: int = 1000):
+        self.traces: deque[dict] = deque(maxlen=maxlen)
+
+    def export(self, trace: Trace):
+        self.traces.append(trace.to_dict())
+
+    def close(self):
+        pass
+
+
+class FileCollector:
+    """
+    트레이스를 JSON Lines 파일에 씁니다. 파일 쓰기는 별도 스레드에서 수행합니다.
+
+    파일이 max_bytes를 넘으면 교체하고 이전 파일은 backup_count개까지만 남깁니다.
+    """
+
+    def __init__(self, path: str, max_bytes: int, backup_count: int, queue_size: int = 10000):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        file_handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter("%(message)s"))
+        self._handler = NonBlockingQueueHandler(queue.Queue(queue_size))
+        self._listener = QueueListener(self._handler.queue, file_handler)
+        self._listener.start()
+
+    def export(self, trace: Trace):
+        record = logging.LogRecord("trace", logging.INFO, __file__, 0, json.dumps(trace.to_dict()), None, None)
+        self._handler.handle(record)
+
+    def close(self):
+        self._listener.stop()
+
+
+class Tracer:
+    """
+    요청 트레이스를 tail 기반으로 샘플링해 내보냅니다.
+
+    요청이 끝난 뒤 전체 시간이 slow_threshold초 이상이거나 5xx 응답이면 항상 내보내고,
+    나머지는 sample_rate 비율만 내보냅니다.
+    """
+
+    def __init__(self, collector: InMemoryCollector | FileCollector, slow_threshold: float, sample_rate: float):
+        self.collector = collector
+        self.slow_threshold = slow_threshold
+        self.sample_rate = sample_rate
+
+    def should_export(self, trace: Trace, status_code: int) -> bool:
+        return (
+            trace.duration >= self.slow_threshold
+            or status_code >= 500
+            or random.random() < self.sample_rate
+        )
+
+    def finish(self, trace: Trace, status_code: int):
+        if not self.should_export(trace, status_code):
+            return
+        try:
+            self.collector.export(trace)
+        except Exception as e:
+            logger.warning(f"트레이스 내보내기 실패: {str(e)}")
+
+
+class TracingTransport(httpx.AsyncBaseTransport):
+    """외부 HTTP 호출마다 스팬을 기록하는 httpx 트랜스포트 래퍼입니다."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, service: str):
+        self.transport = transport
+        self.service = service
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with span(f"http.{self.service}", method=request.method, url=f"{request.url.host}{request.url.path}") as current:
+            response = await self.transport.handle_async_request(request)
+            if current is not None:
+                current.attributes["status"] = response.status_code
+            return response
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class TracedJSONResponse(JSONResponse):
+    """본문 직렬화(JSON 인코딩)를 "response.serialize" 스팬으로 남기는 기본 응답 클래스입니다."""
+
+    def render(self, content) -> bytes:
+        with span("response.serialize"):
+            return super().render(content)
+
+
+_tracer: Tracer | None = None
+
+
+def setup_tracing() -> Tracer:
+    """설정에 맞는 수집기로 Tracer를 만듭니다. 여러 번 호출해도 한 번만 만듭니다."""
+    global _tracer
+    if _tracer is not None:
+        return _tracer
+
+    if settings.TRACE_EXPORTER == "memory":
+        collector = InMemoryCollector(settings.TRACE_MEMORY_SIZE)
+    else:
+        collector = FileCollector(
+            settings.TRACE_FILE or os.path.join(settings.LOG_DIR, "traces.jsonl"),
+            max_bytes=settings.TRACE_FILE_MAX_BYTES,
+            backup_count=settings.TRACE_FILE_BACKUP_COUNT,
+        )
+        atexit.register(collector.close)
+
+    _tracer = Tracer(collector, settings.TRACE_SLOW_THRESHOLD_SECONDS, settings.TRACE_SAMPLE_RATE)
+    return _tracer
@@ -1,19 +1,61 @@
 from redis.asyncio import Redis
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 
 from src.main.core.config import settings
+from src.main.core.metrics import CallbackGauge, registry
+from src.main.db.pool import InstrumentedAsyncQueuePool
+from src.main.db.routing import ReplicaSet, RoutingSession
 
 Base = declarative_base()
 
-engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI), echo=True)
+def create_engine_from_settings(database_uri: str):
+    """설정값으로 비동기 엔진을 생성합니다. SQL 로깅은 DB_ECHO로만 켭니다."""
+    url = make_url(database_uri)
+    options = {"echo": settings.DB_ECHO}
+
+    if url.get_backend_name() != "sqlite":
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
+
+    if url.get_driver_name() == "asyncpg":
+        # SQLAlchemy와 asyncpg의 prepared statement 캐시 (PgBouncer transaction 모드에서는 0)
+        url = url.update_query_dict({"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)})
+        options["connect_args"] = {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+
+    return create_async_engine(url, **options)
+
+engine = create_engine_from_settings(str(settings.SQLALCHEMY_DATABASE_URI))
+
+# 읽기 레플리카 (설정이 없으면 모든 쿼리를 프라이머리로 보냄)
+replica_set = ReplicaSet(
+    [create_engine_from_settings(uri) for uri in settings.SQLALCHEMY_REPLICA_URIS],
+    max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS
+)
+
+class AppSession(RoutingSession):
+    replica_set = replica_set
+
+def pool_stats() -> dict:
+    """커넥션 풀 체크아웃 대기 시간과 포화도. 계측 풀이 아닌 경우(sqlite 등) 빈 dict를 반환합니다."""
+    if isinstance(engine.pool, InstrumentedAsyncQueuePool):
+        return engine.pool.stats()
+    return {}
 
 AsyncSessionLocal = sessionmaker (
     autocommit=False,    # False인 경우 자동으로 트랜잭션 커밋 X   
     autoflush=False,     # True인 경우 쿼리 작업 실행 전 보류 중인 DB 변경 사항을 자동으로 Flush 
     bind=engine,
     class_=AsyncSession,
+    sync_session_class=AppSession,
     expire_on_commit=False
 )
 
@@ -23,3 +65,14 @@ redis_client = Redis(
     decode_responses=True,
     db=0
 )
+
+def _pool_metrics() -> dict:
+    stats = pool_stats()
+    keys = ("checked_out", "overflow", "saturation", "wait_avg", "wait_max", "timeouts")
+    return {(key,): stats[key] for key in keys if key in stats}
+
+def _replica_metrics() -> dict:
+    return {(replica["url"],): replica["lag"] if replica["healthy"] else -1 for replica in replica_set.stats()}
+
+registry.register(CallbackGauge("db_pool", "DB 커넥션 풀 상태 (checkout 대기 시간은 초 단위)", ("stat",), _pool_metrics))
+registry.register(CallbackGauge("db_replica_lag_seconds", "레플리카 복제 지연 (사용 불가 시 -1)", ("replica",), _replica_metrics))
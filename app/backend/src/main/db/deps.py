@@ -1,14 +1,82 @@
+import inspect
+from typing import Awaitable, Callable
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
 from src.main.db.database import AsyncSessionLocal
 
-async def get_db():
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
-        # with을 사용하면 알아서 session을 닫아줌
-        # await session.close()
\ No newline at end of file
+
+class RequestSession:
+    """
+    요청 단위로 공유하는 지연 생성 DB 세션입니다.
+
+    AuthMiddleware가 요청마다 하나를 만들어 request.state.db에 두고, get_db 의존성과
+    request.state.user 조회가 같은 세션을 사용합니다. 커밋/롤백은 get_db에서 요청당 한 번,
+    세션 종료는 미들웨어에서 요청이 끝날 때 수행합니다.
+    """
+
+    def __init__(self, session_factory: sessionmaker = AsyncSessionLocal):
+        self.session_factory = session_factory
+        self._session: AsyncSession | None = None
+
+    @property
+    def opened(self) -> bool:
+        return self._session is not None
+
+    def get(self) -> AsyncSession:
+        # AsyncSession은 첫 쿼리 전까지 커넥션을 잡지 않음
+        if self._session is None:
+            self._session = self.session_factory()
+        return self._session
+
+    async def commit(self):
+        if self._session is None:
+            return
+        await self._session.commit()
+        callbacks = self._session.info.pop("after_commit", [])
+        for callback in callbacks:
+            result = callback()
+            if inspect.isawaitable(result):
+                await result
+
+    async def rollback(self):
+        if self._session is not None:
+            self._session.info.pop("after_commit", None)
+            await self._session.rollback()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def run_after_commit(db: AsyncSession, callback: Callable[[], Awaitable[None] | None]):
+    """
+    요청의 작업 단위가 커밋된 뒤 실행할 콜백을 등록합니다. 롤백되면 실행하지 않습니다.
+
+    콜백이 코루틴을 반환하면 커밋 직후 기다립니다.
+    """
+    db.info.setdefault("after_commit", []).append(callback)
+
+
+def get_request_session(request: Request) -> RequestSession:
+    request_session = getattr(request.state, "db", None)
+    if request_session is None:
+        # 미들웨어를 거치지 않은 경우(테스트 등)
+        request_session = RequestSession()
+        request.state.db = request_session
+    return request_session
+
+
+async def get_db(request: Request):
+    request_session = get_request_session(request)
+    try:
+        yield request_session.get()
+        await request_session.commit()
+    except Exception:
+        await request_session.rollback()
+        raise
+    finally:
+        await request_session.close()
@@ -0,0 +1,54 @@
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# 체크아웃 호출마다(코루틴별로) 재귀 여부를 따로 추적 (스레드 로컬은 같은 루프의 코루틴끼리 공유됨)
+_measuring: ContextVar[bool] = ContextVar("pool_checkout_measuring", default=False)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    커넥션 체크아웃 대기 시간과 포화도를 집계하는 커넥션 풀입니다.
+
+    stats()의 wait_* 값은 체크아웃 요청부터 커넥션을 받을 때까지(새 커넥션 생성 포함)의 시간이며,
+    saturation은 사용 중인 커넥션 수 / (pool_size + max_overflow) 입니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats = {"checkouts": 0, "timeouts": 0, "wait_total": 0.0, "wait_max": 0.0}
+
+    def _do_get(self):
+        # QueuePool._do_get은 오버플로 경합 시 재귀 호출하므로 가장 바깥 호출만 측정
+        if _measuring.get():
+            return super()._do_get()
+
+        token = _measuring.set(True)
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self._stats["timeouts"] += 1
+            raise
+        finally:
+            _measuring.reset(token)
+            waited = time.perf_counter() - started
+            self._stats["wait_total"] += waited
+            self._stats["wait_max"] = max(self._stats["wait_max"], waited)
+        self._stats["checkouts"] += 1
+        return entry
+
+    def stats(self) -> dict:
+        capacity = self.size() + max(self._max_overflow, 0)
+        checked_out = self.checkedout()
+        checkouts = self._stats["checkouts"]
+        return {
+            **self._stats,
+            "wait_avg": self._stats["wait_total"] / checkouts if checkouts else 0.0,
+            "size": self.size(),
+            "checked_out": checked_out,
+            "overflow": self.overflow(),
+            "saturation": checked_out / capacity if capacity else 0.0,
+        }
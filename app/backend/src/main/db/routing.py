@@ -0,0 +1,128 @@
+import asyncio
+import itertools
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger(__name__)
+
+# 레플리카로 보내도 되는 조회 문장에 붙이는 실행 옵션
+#   select(User).where(...).execution_options(**REPLICA_READ)
+REPLICA_READ = {"replica_read": True}
+
+_POSTGRES_LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class ReplicaState:
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.healthy = False
+        self.lag: float | None = None
+
+
+class ReplicaSet:
+    """
+    읽기 레플리카 엔진 목록과 상태입니다.
+
+    run()이 주기적으로 각 레플리카의 연결 상태와 복제 지연을 확인하고,
+    choose()는 정상이면서 지연이 max_lag초 이하인 레플리카를 라운드 로빈으로 고릅니다.
+    사용할 수 있는 레플리카가 없으면 None을 반환하며, 이 경우 프라이머리로 조회합니다.
+    """
+
+    def __init__(self, engines: list[AsyncEngine], max_lag: float):
+        self.replicas = [ReplicaState(engine) for engine in engines]
+        self.max_lag = max_lag
+        self._next = itertools.count()
+
+    def choose(self) -> AsyncEngine | None:
+        available = [
+            replica for replica in self.replicas
+            if replica.healthy and replica.lag is not None and replica.lag <= self.max_lag
+        ]
+        if not available:
+            return None
+        return available[next(self._next) % len(available)].engine
+
+    async def _check(self, replica: ReplicaState, timeout: float):
+        try:
+            async with asyncio.timeout(timeout):
+                async with replica.engine.connect() as conn:
+                    if replica.engine.dialect.name == "postgresql":
+                        replica.lag = float(await conn.scalar(_POSTGRES_LAG_QUERY))
+                    else:
+                        await conn.execute(text("SELECT 1"))
+                        replica.lag = 0.0
+            if not replica.healthy:
+                logger.info(f"레플리카 사용 가능: {replica.engine.url} (lag={replica.lag:.2f}s)")
+            replica.healthy = True
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if replica.healthy:
+                logger.warning(f"레플리카 사용 불가, 프라이머리로 조회합니다: {replica.engine.url}: {str(e)}")
+            replica.healthy = False
+
+    async def check(self, timeout: float):
+        await asyncio.gather(*(self._check(replica, timeout) for replica in self.replicas))
+
+    async def run(self, interval: float):
+        """app_lifespan에서 백그라운드 태스크로 실행합니다."""
+        while True:
+            await self.check(timeout=interval)
+            await asyncio.sleep(interval)
+
+    async def dispose(self):
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> list[dict]:
+        return [
+            {"url": str(replica.engine.url), "healthy": replica.healthy, "lag": replica.lag}
+            for replica in self.replicas
+        ]
+
+
+class RoutingSession(Session):
+    """
+    REPLICA_READ 옵션이 붙은 조회만 레플리카로 보내고, 나머지는 프라이머리(bind)로 보내는 세션입니다.
+
+    세션에서 한 번이라도 쓰기(flush, INSERT/UPDATE/DELETE)가 일어나면 이후 조회도 프라이머리로 보내
+    같은 요청 안에서 자신이 쓴 데이터를 읽을 수 있게 합니다.
+    """
+
+    replica_set: ReplicaSet | None = None
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        self.info["replica_bind"] = False
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["has_writes"] = True
+        elif (
+            self.replica_set is not None
+            and not self.info.get("has_writes")
+            and isinstance(clause, Executable)
+            and clause.get_execution_options().get("replica_read")
+        ):
+            replica = self.replica_set.choose()
+            if replica is not None:
+                self.info["replica_bind"] = True
+                return replica.sync_engine
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+def has_writes(session) -> bool:
+    """세션에서 아직 커밋되지 않았을 수 있는 쓰기가 있었는지 반환합니다."""
+    return bool(session.info.get("has_writes"))
+
+
+def last_read_from_replica(session) -> bool:
+    """세션의 마지막 문장이 레플리카에서 실행되었는지 반환합니다. (복제 지연으로 오래된 값일 수 있음)"""
+    return bool(session.info.get("replica_bind"))
@@ -0,0 +1,47 @@
+import logging
+
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+
+
+class SchemaRevisionError(RuntimeError):
+    pass
+
+
+def get_head_revisions() -> set[str]:
+    """마이그레이션 스크립트의 head 리비전 (파일만 읽고 DB는 조회하지 않음)"""
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+async def verify_schema_revision(engine: AsyncEngine):
+    """
+    DB 스키마가 마이그레이션 head와 같은지 확인합니다. 쿼리는 alembic_version 조회 한 번입니다.
+
+    스키마 변경은 배포 단계에서 `alembic upgrade head`로 먼저 적용하며, 워커는 DDL을 실행하지 않습니다.
+    """
+    heads = get_head_revisions()
+    try:
+        async with engine.connect() as conn:
+            current = set((await conn.execute(text("SELECT version_num FROM alembic_version"))).scalars())
+    except DBAPIError as e:
+        raise SchemaRevisionError(
+            f"alembic_version을 조회할 수 없습니다. 'alembic upgrade head'를 먼저 실행하세요: {str(e)}"
+        ) from e
+
+    if current != heads:
+        raise SchemaRevisionError(
+            f"DB 스키마 리비전({', '.join(sorted(current)) or '없음'})이 "
+            f"마이그레이션 head({', '.join(sorted(heads))})와 다릅니다. 'alembic upgrade head'를 실행하세요."
+        )
+    logger.info(f"DB 스키마 리비전 확인 완료: {', '.join(sorted(current))}")
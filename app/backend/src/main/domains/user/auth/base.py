@@ -1,8 +1,20 @@
 from abc import ABC, abstractmethod
+import httpx
 from fastapi import Request
+from src.main.core.exceptions import ServiceUnavailableError
 from src.main.domains.user.schemas.user import UserCreate
 
 class SocialLoginBase(ABC):
+    @staticmethod
+    def raise_for_unavailable(response: httpx.Response):
+        """
+        제공자 장애(5xx)나 요청 제한(429) 응답이면 ServiceUnavailableError를 발생시킵니다.
+
+        서킷 브레이커는 이 예외만 제공자 장애로 집계하고, 나머지 4xx(잘못된 code 등)는 요청 자체의 문제로 봅니다.
+        """
+        if response.status_code == 429 or response.status_code >= 500:
+            raise ServiceUnavailableError(f"제공자 응답 오류: HTTP {response.status_code}")
+
     @abstractmethod
     async def get_authorization_url(self, request: Request, state_token: str) -> str:
         """
@@ -15,11 +27,14 @@ class SocialLoginBase(ABC):
         pass
 
     @abstractmethod
-    async def get_user_info(self, request: Request) -> UserCreate:
+    async def get_user_info(self, code: str, state: str) -> UserCreate:
         """
         OAuth 제공자로부터 사용자 정보를 가져옵니다.
         
-        :param request: FastAPI Request 객체
+        state 검증과 삭제는 호출 전에 AuthService에서 consume_oauth_state로 이미 처리됩니다.
+
+        :param code: 인가 코드
+        :param state: 검증이 끝난 OAuth state
         :return: UserCreate 객체
         """
         pass
\ No newline at end of file
@@ -1,6 +1,7 @@
 from src.main.domains.user.repository.token_repository import TokenRepository
 from src.main.domains.user.auth.providers.kakao import KakaoLogin
 from src.main.domains.user.auth.providers.naver import NaverLogin
+from src.main.domains.user.auth.http_client import provider_http_clients
 # from src.main.core.auth.oauth import oauth
 from .providers.google import GoogleLogin
 
@@ -8,10 +9,10 @@ class SocialLoginFactory:
     @staticmethod
     def get_social_login(provider: str, token_repository: TokenRepository):
         if provider == 'google':
-            return GoogleLogin(token_repository)
+            return GoogleLogin(token_repository, provider_http_clients.get(provider))
         elif provider == 'naver':
-            return NaverLogin(token_repository)
+            return NaverLogin(token_repository, provider_http_clients.get(provider))
         elif provider == 'kakao':
-            return KakaoLogin(token_repository)
+            return KakaoLogin(token_repository, provider_http_clients.get(provider))
         else:
             raise ValueError(f"지원하지 않는 제공자: {provider}")
\ No newline at end of file
@@ -0,0 +1,101 @@
+import importlib.util
+import logging
+
+import httpx
+
+from src.main.core.circuit_breaker import CircuitBreaker
+from src.main.core.config import settings
+from src.main.core.metrics import PROVIDER_CALL_SECONDS, CallbackGauge, registry
+from src.main.core.tracing import TracingTransport
+
+logger = logging.getLogger(__name__)
+
+SOCIAL_PROVIDERS = ("google", "naver", "kakao")
+
+
+class ProviderHttpClients:
+    """
+    소셜 로그인 제공자별 공유 httpx.AsyncClient와 서킷 브레이커 레지스트리입니다.
+
+    app_lifespan에서 생성하고 종료하며, 커넥션 풀과 keep-alive로 로그인마다 TCP/TLS 핸드셰이크를 반복하지 않습니다.
+    제공자마다 커넥션 풀과 브레이커가 분리되어 있어 한 제공자가 느려져도 다른 로그인 방식에 영향이 없습니다.
+    """
+
+    def __init__(self):
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._breakers = {
+            provider: CircuitBreaker(
+                provider,
+                timeout=settings.OAUTH_CALL_TIMEOUT_SECONDS,
+                max_concurrency=settings.OAUTH_MAX_CONCURRENT_CALLS,
+                failure_threshold=settings.OAUTH_BREAKER_FAILURE_THRESHOLD,
+                recovery_timeout=settings.OAUTH_BREAKER_RECOVERY_SECONDS,
+                latency_histogram=PROVIDER_CALL_SECONDS,
+            )
+            for provider in SOCIAL_PROVIDERS
+        }
+
+    @staticmethod
+    def _create_client(provider: str) -> httpx.AsyncClient:
+        http2 = settings.OAUTH_HTTP2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("h2 패키지가 없어 HTTP/1.1로 제공자에 연결합니다.")
+            http2 = False
+
+        # transport를 직접 넘기면 클라이언트의 http2/limits 인자는 무시되므로 트랜스포트에 설정
+        transport = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.OAUTH_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.OAUTH_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.OAUTH_HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+        return httpx.AsyncClient(
+            # 제공자 호출마다 요청 트레이스에 스팬을 남김
+            transport=TracingTransport(transport, provider),
+            timeout=httpx.Timeout(
+                connect=settings.OAUTH_HTTP_CONNECT_TIMEOUT,
+                read=settings.OAUTH_HTTP_READ_TIMEOUT,
+                write=settings.OAUTH_HTTP_WRITE_TIMEOUT,
+                pool=settings.OAUTH_HTTP_POOL_TIMEOUT,
+            ),
+        )
+
+    def startup(self):
+        for provider in SOCIAL_PROVIDERS:
+            if provider not in self._clients:
+                self._clients[provider] = self._create_client(provider)
+        logger.info(f"소셜 로그인 HTTP 클라이언트 생성 완료: {', '.join(self._clients)}")
+
+    def get(self, provider: str) -> httpx.AsyncClient:
+        client = self._clients.get(provider)
+        if client is None or client.is_closed:
+            # lifespan 밖(테스트, 스크립트 등)에서 호출된 경우
+            client = self._clients[provider] = self._create_client(provider)
+        return client
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        return self._breakers[provider]
+
+    def stats(self) -> dict[str, dict]:
+        return {provider: breaker.stats() for provider, breaker in self._breakers.items()}
+
+    async def aclose(self):
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+
+provider_http_clients = ProviderHttpClients()
+
+_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+registry.register(CallbackGauge(
+    "oauth_provider_circuit_state", "제공자별 서킷 상태 (0=closed, 1=half_open, 2=open)", ("provider",),
+    lambda: {(provider,): _CIRCUIT_STATE_VALUES[stats["state"]] for provider, stats in provider_http_clients.stats().items()}
+))
+registry.register(CallbackGauge(
+    "oauth_provider_in_flight", "제공자별 진행 중인 호출 수", ("provider",),
+    lambda: {(provider,): stats["in_flight"] for provider, stats in provider_http_clients.stats().items()}
+))
@@ -3,6 +3,8 @@ import httpx
 from asyncio.log import logger
 from urllib.parse import urlencode
 from fastapi import Request
+from jose import JWTError
+from src.main.core.auth.oidc import ProviderMetadataCache, verify_id_token
 from src.main.domains.user.repository.token_repository import TokenRepository
 from src.main.core.exceptions import AuthenticationError, InternalServerError
 from src.main.domains.user.schemas.social_auth import GoogleUserInfo
@@ -10,16 +12,24 @@ from src.main.domains.user.schemas.user import UserCreate
 from src.main.domains.user.auth.base import SocialLoginBase
 from src.main.core.config import settings
 
+google_metadata = ProviderMetadataCache(
+    settings.GOOGLE_DISCOVERY_URL,
+    jwks_url=settings.GOOGLE_JWKS_URL,
+    refresh_margin=settings.OIDC_METADATA_REFRESH_MARGIN_SECONDS,
+)
+
 
 class GoogleLogin(SocialLoginBase):
-    def __init__(self, token_repository: TokenRepository):
+    def __init__(self, token_repository: TokenRepository, http_client: httpx.AsyncClient):
         self.token_repository = token_repository
+        self.http_client = http_client
         self.client_id = settings.GOOGLE_CLIENT_ID
         self.client_secret = settings.GOOGLE_CLIENT_SECRET
         self.redirect_uri = settings.GOOGLE_REDIRECT_URI
-        self.authorize_url = settings.GOOGLE_AUTHORIZE_URL
-        self.token_url = settings.GOOGLE_TOKEN_URL
-        self.userinfo_url = settings.GOOGLE_USERINFO_URL
+        # discovery 문서를 받기 전(또는 실패 시)에는 설정값 사용
+        self.authorize_url = google_metadata.endpoint("authorization_endpoint", settings.GOOGLE_AUTHORIZE_URL)
+        self.token_url = google_metadata.endpoint("token_endpoint", settings.GOOGLE_TOKEN_URL)
+        self.userinfo_url = google_metadata.endpoint("userinfo_endpoint", settings.GOOGLE_USERINFO_URL)
 
     async def get_authorization_url(self) -> str:
         try:
@@ -44,40 +54,38 @@ class GoogleLogin(SocialLoginBase):
             raise
     
     async def get_user_info(self, code: str, state: str) -> UserCreate:
-        # state 검증
-        if not await self.token_repository.verify_oauth_state(state, 'google'):
-            raise AuthenticationError("유효하지 않은 OAuth state")
-        
-        # state 삭제 (재사용 방지)
-        await self.token_repository.delete_oauth_state(state)
-        
-        async with httpx.AsyncClient() as client:
-            token_response = await client.post(self.token_url, data={
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "code": code,
-                "grant_type": "authorization_code",
-                "redirect_uri": self.redirect_uri
-            })
+        token_response = await self.http_client.post(self.token_url, data={
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "code": code,
+            "grant_type": "authorization_code",
+            "redirect_uri": self.redirect_uri
+        })
 
+        self.raise_for_unavailable(token_response)
         if token_response.status_code != 200:
             raise AuthenticationError(f"액세스 토큰을 검색하지 못했습니다: {token_response.text}")
 
-        access_token = token_response.json().get('access_token')
-        logger.debug(f"Access token 획득: {access_token}")
+        token_data = token_response.json()
+        access_token = token_data.get('access_token')
+        logger.debug("Access token 획득")
+
+        # id_token 로컬 검증 (userinfo 요청 생략)
+        user_info = await self._get_user_info_from_id_token(token_data.get('id_token'), access_token)
 
-        # 사용자 정보 획득
-        async with httpx.AsyncClient() as client:
-            user_response = await client.get(
+        if user_info is None:
+            # 사용자 정보 획득 (id_token이 없거나 검증할 수 없는 경우)
+            user_response = await self.http_client.get(
                 self.userinfo_url,
                 headers={"Authorization": f"Bearer {access_token}"}
             )
 
-        if user_response.status_code != 200:
-            raise AuthenticationError(f"Failed to retrieve user info: {user_response.text}")
+            self.raise_for_unavailable(user_response)
+            if user_response.status_code != 200:
+                raise AuthenticationError(f"Failed to retrieve user info: {user_response.text}")
 
-        user_info = user_response.json()
-        logger.debug(f"사용자 정보 획득: {user_info}")
+            user_info = user_response.json()
+            logger.debug(f"사용자 정보 획득: {user_info}")
 
         google_user = GoogleUserInfo(
             email=user_info['email'],
@@ -86,4 +94,28 @@ class GoogleLogin(SocialLoginBase):
         )
 
         return google_user.to_user_create()
-    
\ No newline at end of file
+
+    async def _get_user_info_from_id_token(self, id_token: str | None, access_token: str | None) -> dict | None:
+        """
+        OIDC id_token을 메모리에 캐시된 JWKS로 검증하고 클레임을 반환합니다.
+
+        id_token이 없거나, JWKS가 아직 준비되지 않았거나, 검증에 실패하거나, 필요한 클레임이 없으면
+        None을 반환하여 userinfo 요청으로 대체합니다. 로그인 요청 중에는 JWKS를 직접 가져오지 않습니다.
+        """
+        issuers = google_metadata.issuers
+        if not id_token or not google_metadata.ready or not issuers:
+            return None
+
+        try:
+            claims = verify_id_token(id_token, google_metadata.jwks, self.client_id, issuers, access_token)
+        except JWTError as e:
+            # 키 교체 직후일 수 있으므로 백그라운드 갱신을 앞당김
+            logger.warning(f"구글 id_token 검증 실패, userinfo로 대체합니다: {str(e)}")
+            google_metadata.request_refresh()
+            return None
+
+        if not claims.get('email_verified') or not claims.get('email') or not claims.get('name'):
+            return None
+
+        logger.debug(f"id_token에서 사용자 정보 획득: {claims.get('email')}")
+        return claims
@@ -11,8 +11,9 @@ from src.main.domains.user.auth.base import SocialLoginBase
 
 
 class KakaoLogin(SocialLoginBase):
-    def __init__(self, token_repository: TokenRepository):
+    def __init__(self, token_repository: TokenRepository, http_client: httpx.AsyncClient):
         self.token_repository = token_repository
+        self.http_client = http_client
         self.client_id = settings.KAKAO_REST_API_KEY
         self.client_secret = settings.KAKAO_CLIENT_SECRET
         self.redirect_uri = settings.KAKAO_REDIRECT_URI
@@ -38,36 +39,30 @@ class KakaoLogin(SocialLoginBase):
             raise
     
     async def get_user_info(self, code: str, state: str) -> UserCreate:
-        # state 검증
-        if not await self.token_repository.verify_oauth_state(state, 'kakao'):
-            raise AuthenticationError("유효하지 않은 OAuth state")
-        
-        # state 삭제 (재사용 방지)
-        await self.token_repository.delete_oauth_state(state)
-
-        async with httpx.AsyncClient() as client:
-            token_response = await client.post(self.token_url, data={
-                "grant_type": "authorization_code",
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "redirect_uri": self.redirect_uri,
-                "code": code
-            })
+        token_response = await self.http_client.post(self.token_url, data={
+            "grant_type": "authorization_code",
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "redirect_uri": self.redirect_uri,
+            "code": code
+        })
 
-            if token_response.status_code != 200:
-                raise AuthenticationError("액세스 토큰을 검색하지 못했습니다.")
-            
-            access_token = token_response.json()['access_token']
+        self.raise_for_unavailable(token_response)
+        if token_response.status_code != 200:
+            raise AuthenticationError("액세스 토큰을 검색하지 못했습니다.")
+        
+        access_token = token_response.json()['access_token']
 
-            user_response = await client.get(
-                self.userinfo_url,
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
+        user_response = await self.http_client.get(
+            self.userinfo_url,
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
 
-            if user_response.status_code!= 200:
-                raise AuthenticationError("사용자 정보를 가져오지 못했습니다.")
-            
-            user_data = user_response.json()
+        self.raise_for_unavailable(user_response)
+        if user_response.status_code!= 200:
+            raise AuthenticationError("사용자 정보를 가져오지 못했습니다.")
+        
+        user_data = user_response.json()
 
         kakao_account = user_data.get('kakao_account', {})
         kakao_user = KakaoUserInfo(
@@ -14,8 +14,9 @@ from src.main.core.config import settings
 logger = logging.getLogger(__name__)
 
 class NaverLogin(SocialLoginBase):
-    def __init__(self, token_repository: TokenRepository):
+    def __init__(self, token_repository: TokenRepository, http_client: httpx.AsyncClient):
         self.token_repository = token_repository
+        self.http_client = http_client
         self.client_id = settings.NAVER_CLIENT_ID
         self.client_secret = settings.NAVER_CLIENT_SECRET
         self.redirect_uri = settings.NAVER_REDIRECT_URI
@@ -42,37 +43,30 @@ class NaverLogin(SocialLoginBase):
             raise
 
     async def get_user_info(self, code: str, state: str) -> UserCreate:
-        # state 검증
-        if not await self.token_repository.verify_oauth_state(state, 'naver'):
-            raise AuthenticationError("유효하지 않은 OAuth state")
-        
-        # state 삭제 (재사용 방지)
-        await self.token_repository.delete_oauth_state(state)
-        
         # Get access token
-        async with httpx.AsyncClient() as client:
-            token_response = await client.post(self.token_url, params={
-                "grant_type": "authorization_code",
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "code": code,
-                "state": state,
-                "redirect_uri": self.redirect_uri
-            })
+        token_response = await self.http_client.post(self.token_url, params={
+            "grant_type": "authorization_code",
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "code": code,
+            "state": state,
+            "redirect_uri": self.redirect_uri
+        })
 
+        self.raise_for_unavailable(token_response)
         if token_response.status_code != 200:
             raise AuthenticationError(f"Failed to retrieve access token: {token_response.text}")
 
         access_token = token_response.json()['access_token']
-        logger.debug(f"Access token 획득: {access_token}")
+        logger.debug("Access token 획득")
 
         # 유저 정보 조회
-        async with httpx.AsyncClient() as client:
-            user_response = await client.get(
-                self.userinfo_url,
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
+        user_response = await self.http_client.get(
+            self.userinfo_url,
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
 
+        self.raise_for_unavailable(user_response)
         if user_response.status_code != 200:
             raise AuthenticationError(f"Failed to retrieve user info: {user_response.text}")
 
@@ -1,4 +1,3 @@
-import logging
 from asyncio.log import logger
 from typing import Tuple
 
@@ -10,12 +9,14 @@ from src.main.domains.user.schemas.user.user_response import UserResponse
 from src.main.domains.user.service.auth_service import AuthService
 from src.main.domains.user.models.user import User
 from src.main.core.config import settings
-from src.main.core.auth.jwt import verify_token
+from src.main.core.auth.context import get_auth_context
 from src.main.core.auth.dependencies import get_current_user
+from src.main.core.auth.routes import PUBLIC_ROUTE
 from src.main.core.exceptions import (
     AuthenticationError,
     InternalServerError, 
     NotFoundError,
+    ServiceUnavailableError,
     ValidationError
 )
 
@@ -23,10 +24,9 @@ from .dependencies import get_auth_service, get_user_repository
 
 router = APIRouter()
 
-logging.basicConfig(level=logging.DEBUG)
 
 
-@router.get("/login/{provider}")
+@router.get("/login/{provider}", openapi_extra=PUBLIC_ROUTE)
 async def social_login(
     provider: str,
     auth_service: AuthService = Depends(get_auth_service)
@@ -40,7 +40,7 @@ async def social_login(
     except Exception as e:
         raise InternalServerError(f"로그인 처리 중 오류 발생: {str(e)}")
 
-@router.get("/auth/{provider}/callback", name="auth_callback")
+@router.get("/auth/{provider}/callback", name="auth_callback", openapi_extra=PUBLIC_ROUTE)
 async def auth_callback(
     request: Request,
     provider: str,
@@ -48,7 +48,6 @@ async def auth_callback(
 ):
     try:
         logger.debug(f"OAuth 콜백 받음. Provider: {provider}")
-        logger.debug(f"요청 쿼리 파라미터: {request.query_params}")
         
         auth_response = await auth_service.handle_oauth_callback(request, provider)
         logger.debug(f"인증 응답 생성됨")
@@ -59,11 +58,17 @@ async def auth_callback(
     except AuthenticationError as e:
         logger.error(f"인증 오류: {str(e)}")
         raise HTTPException(status_code=401, detail=str(e))
+    except ServiceUnavailableError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(int(settings.OAUTH_BREAKER_RECOVERY_SECONDS))}
+        )
     except Exception as e:
         logger.exception(f"예상치 못한 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail="내부 서버 오류가 발생했습니다.")
 
-@router.post("/token/refresh")
+@router.post("/token/refresh", openapi_extra=PUBLIC_ROUTE)
 async def refresh_token(
     request: Request,
     auth_service: AuthService = Depends(get_auth_service)
@@ -98,25 +103,17 @@ async def read_user_info(
     request: Request, 
     user_repository: UserRepository = Depends(get_user_repository)
 ):
-    user = request.state.user
-    logger.info(f"UserInfo 조회 시도. User: {user.id if user else 'None'}")
+    # 미들웨어가 만든 인증 컨텍스트를 재사용하여 토큰 재검증을 피함
+    auth_context = get_auth_context(request)
+    if not auth_context.token:
+        raise HTTPException(status_code=401, detail="No access token provided")
 
-    if not user:
-        token = request.cookies.get("access_token")
-        if not token:
-            raise HTTPException(status_code=401, detail="No access token provided")
-        
-        try:
-            payload = verify_token(token)
-            email = payload.get("sub")
-            user = await user_repository.get_by_email(email)
-            
-            logger.info(f"Verifying token: {token[:10]}...")
-            logger.info(f"Payload: {payload}")
-            logger.info(f"User found: {user}")
-        except Exception as e:
-            logger.error(f"토큰 검증 실패: {str(e)}")
-            raise AuthenticationError("유효하지 않은 토큰입니다.", {str(e)})
+    try:
+        user = await auth_context.get_user(user_repository)
+        logger.info(f"UserInfo 조회 시도. User: {user.id if user else 'None'}")
+    except Exception as e:
+        logger.error(f"토큰 검증 실패: {str(e)}")
+        raise AuthenticationError("유효하지 않은 토큰입니다.")
 
     if not user:
         raise NotFoundError("유저를 찾을 수 없습니다.")
@@ -131,7 +128,7 @@ async def logout(
 ):
     current_user, token = current_user_and_token
     try:    
-        await auth_service.logout(token, current_user.email)
+        await auth_service.logout(token, str(current_user.id))
 
         response = JSONResponse(content={"message": "로그아웃 성공"})
         response.delete_cookie(key="access_token")
@@ -141,3 +138,15 @@ async def logout(
         logger.error(f"로그아웃 에러 발생: {str(e)}", exc_info=True)
         raise InternalServerError("로그아웃 처리 중 오류가 발생했습니다.")
 
+@router.post("/logout/all")
+async def logout_all(
+    current_user_and_token: Tuple[User, str] = Depends(get_current_user),
+    auth_service: AuthService = Depends(get_auth_service),
+):
+    current_user, _ = current_user_and_token
+    await auth_service.revoke_all_sessions(str(current_user.id))
+
+    response = JSONResponse(content={"message": "모든 기기에서 로그아웃 되었습니다."})
+    response.delete_cookie(key="access_token")
+    response.delete_cookie(key="refresh_token")
+    return response
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+
+from src.main.db.database import Base
+
+class LoginEvent(Base):
+    __tablename__ = 'login_events'
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), index=True, nullable=False)
+    event_type = Column(String(20), nullable=False)     # login, refresh
+    provider = Column(String(20), nullable=True)        # google, naver, kakao (refresh는 None)
+    created_at = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+
+from datetime import datetime, timezone
+
+from sqlalchemy import bindparam, insert, or_, select, update
+from sqlalchemy.orm import sessionmaker
+
+from src.main.core.config import settings
+from src.main.db.database import AsyncSessionLocal
+from src.main.domains.user.models.login_event import LoginEvent
+from src.main.domains.user.models.user import User
+from src.main.domains.user.repository.user_cache import UserCache, user_cache
+
+logger = logging.getLogger(__name__)
+
+_users = User.__table__
+# 늦게 기록되는 배치(재시도 등)가 upsert_user나 다른 워커가 기록한 더 최근 last_login을 덮어쓰지 않도록 조건부 갱신
+_UPDATE_LAST_LOGIN = (
+    update(_users)
+    .where(_users.c.id == bindparam("user_id"))
+    .where(or_(_users.c.last_login.is_(None), _users.c.last_login < bindparam("occurred_at")))
+    .values(last_login=bindparam("occurred_at"))
+)
+
+
+class LoginActivityBuffer:
+    """
+    last_login 갱신과 로그인 이벤트를 모아 배치로 기록하는 write-behind 버퍼입니다.
+
+    요청 경로에서는 record()로 큐에 넣기만 하고, run()이 flush_interval마다(또는 batch_size만큼 쌓이면 바로)
+    last_login은 한 번의 bulk UPDATE로, 이벤트는 다중 행 INSERT로 기록합니다.
+    큐가 가득 차면 요청을 기다리게 하지 않고 해당 기록을 버리며 dropped로 집계합니다.
+
+    저장에 실패한 배치는 다음 flush에서 max_retries번까지 다시 시도하고, 그래도 실패하면 버립니다.
+    last_login을 갱신한 유저의 캐시는 커밋 후 무효화합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        maxsize: int,
+        batch_size: int,
+        flush_interval: float,
+        max_retries: int = 1,
+        cache: UserCache | None = None
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.cache = cache or user_cache
+        self.dropped = 0
+        # (user_id, event_type, provider, occurred_at, update_last_login, 실패 횟수)
+        self._queue: asyncio.Queue[tuple[int, str, str | None, datetime, bool, int]] = asyncio.Queue(maxsize)
+        self._flush_requested = asyncio.Event()
+
+    def record(self, user_id: int, event_type: str, provider: str | None = None, update_last_login: bool = True):
+        item = (user_id, event_type, provider, datetime.now(timezone.utc), update_last_login, 0)
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            self._flush_requested.set()
+            return
+        if self._queue.qsize() >= self.batch_size:
+            self._flush_requested.set()
+
+    async def flush(self):
+        """flush 시작 시점까지 쌓인 기록을 batch_size 단위로 기록합니다. 재시도로 다시 넣은 기록은 다음 flush에서 처리합니다."""
+        remaining = self._queue.qsize()
+        while remaining > 0 and not self._queue.empty():
+            batch = [self._queue.get_nowait() for _ in range(min(self.batch_size, remaining, self._queue.qsize()))]
+            remaining -= len(batch)
+            # 종료 시 태스크가 취소되어도 꺼낸 배치는 끝까지 기록
+            await asyncio.shield(self._write(batch))
+
+    def _requeue(self, batch: list[tuple[int, str, str | None, datetime, bool, int]]):
+        for *item, failures in batch:
+            if failures >= self.max_retries:
+                self.dropped += 1
+                continue
+            try:
+                self._queue.put_nowait((*item, failures + 1))
+            except asyncio.QueueFull:
+                self.dropped += 1
+
+    async def _write(self, batch: list[tuple[int, str, str | None, datetime, bool, int]]):
+        last_logins: dict[int, datetime] = {}
+        events = []
+        for user_id, event_type, provider, occurred_at, update_last_login, _ in batch:
+            if update_last_login:
+                last_logins[user_id] = max(occurred_at, last_logins.get(user_id, occurred_at))
+            events.append({
+                "user_id": user_id,
+                "event_type": event_type,
+                "provider": provider,
+                "created_at": occurred_at,
+            })
+
+        updated_users: list[tuple[int, str]] = []
+        try:
+            async with self.session_factory() as session:
+                if last_logins:
+                    # 기본 키 기준 bulk UPDATE (executemany)
+                    await session.execute(
+                        _UPDATE_LAST_LOGIN,
+                        [{"user_id": user_id, "occurred_at": occurred_at} for user_id, occurred_at in last_logins.items()]
+                    )
+                    # 캐시 키(id, email)를 알기 위해 갱신된 유저의 이메일 조회
+                    result = await session.execute(select(User.id, User.email).where(User.id.in_(last_logins)))
+                    updated_users = [tuple(row) for row in result]
+                await session.execute(insert(LoginEvent), events)
+                await session.commit()
+        except Exception as e:
+            self._requeue(batch)
+            logger.error(f"로그인 기록 배치 저장 실패 ({len(batch)}건): {str(e)}")
+            return
+
+        if updated_users:
+            await self.cache.invalidate_many(updated_users)
+        logger.debug(f"로그인 기록 배치 저장 완료: 이벤트 {len(events)}건, last_login {len(last_logins)}건")
+
+    async def run(self):
+        """app_lifespan에서 백그라운드 태스크로 실행합니다. 종료 시에는 태스크를 취소한 뒤 flush()를 호출합니다."""
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+
+login_activity = LoginActivityBuffer(
+    AsyncSessionLocal,
+    maxsize=settings.LOGIN_ACTIVITY_QUEUE_SIZE,
+    batch_size=settings.LOGIN_ACTIVITY_BATCH_SIZE,
+    flush_interval=settings.LOGIN_ACTIVITY_FLUSH_SECONDS,
+)
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+
+from redis.asyncio import Redis
+
+from src.main.core.auth.jwt import token_digest
+from src.main.core.bloom import BloomFilter
+from src.main.core.cache import TTLCache
+from src.main.core.config import settings
+from src.main.db.database import redis_client
+
+logger = logging.getLogger(__name__)
+
+REVOKED_TOKEN_PREFIX = "revoked_token:"
+REVOCATION_CHANNEL = "token_revocations"
+TOKEN_GENERATION_CHANNEL = "token_generations"
+# 이전 버전에서 사용하던 만료 없는 전역 블랙리스트 Set (원본 토큰 저장)
+LEGACY_BLACKLIST_KEY = "token_blacklist"
+
+
+class RevocationFilter:
+    """
+    폐기된 토큰 다이제스트의 워커 로컬 Bloom 필터 사본입니다.
+
+    음성 결과는 Redis 조회 없이 바로 "폐기되지 않음"으로 판단하고, 양성 결과만 Redis에서 확인합니다.
+    새 폐기는 Redis pub/sub으로 전파받고, 만료된 항목은 주기적인 재구성으로 정리합니다.
+    구독이 끊겼거나 첫 구성이 끝나기 전에는 ready가 False이며, 이때는 항상 Redis로 확인합니다.
+
+    유저별 토큰 세대(generation) 값도 짧은 TTL로 캐시하며, 세대가 올라가면 pub/sub으로 캐시를 비웁니다.
+
+    마이그레이션 전의 레거시 블랙리스트 Set이 남아 있으면 그 토큰도 필터에 넣고 legacy_blacklist를 True로 두어,
+    양성 결과를 레거시 Set에서도 확인하게 합니다. Set이 비면 다음 재구성부터 추가 확인을 하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        capacity: int,
+        error_rate: float,
+        rebuild_interval: float,
+        generation_ttl: float = 30,
+        generation_cache_size: int = 10000
+    ):
+        self.redis_client = redis_client
+        self.generations = TTLCache(maxsize=generation_cache_size, default_ttl=generation_ttl)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_interval = rebuild_interval
+        self.ready = False
+        # 첫 재구성에서 확인하기 전까지는 레거시 Set이 남아 있다고 가정
+        self.legacy_blacklist = True
+        self._filter = BloomFilter(capacity, error_rate)
+        self._pending: list[str] | None = None
+        self._subscribed = asyncio.Event()
+
+    def add(self, digest: str):
+        self._filter.add(digest)
+        if self._pending is not None:
+            self._pending.append(digest)
+
+    def might_contain(self, digest: str) -> bool:
+        if not self.ready:
+            return True
+        return digest in self._filter
+
+    async def rebuild(self):
+        """Redis의 폐기 키를 스캔해 필터를 새로 만들고 교체합니다. 스캔 중 들어온 폐기도 반영합니다."""
+        self._pending = []
+        try:
+            digests = []
+            async for key in self.redis_client.scan_iter(match=f"{REVOKED_TOKEN_PREFIX}*", count=1000):
+                digests.append(key[len(REVOKED_TOKEN_PREFIX):])
+
+            new_filter = BloomFilter(max(self.capacity, len(digests) * 2), self.error_rate)
+            for digest in digests:
+                new_filter.add(digest)
+            for digest in self._pending:
+                new_filter.add(digest)
+
+            legacy_count = 0
+            async for token in self.redis_client.sscan_iter(LEGACY_BLACKLIST_KEY, count=1000):
+                new_filter.add(token_digest(token))
+                legacy_count += 1
+        finally:
+            self._pending = None
+
+        self._filter = new_filter
+        self.legacy_blacklist = legacy_count > 0
+        logger.info(f"토큰 폐기 필터 재구성 완료: {len(digests)}건 (레거시 블랙리스트 {legacy_count}건)")
+
+    async def listen(self):
+        pubsub = self.redis_client.pubsub()
+        try:
+            await pubsub.subscribe(REVOCATION_CHANNEL, TOKEN_GENERATION_CHANNEL)
+            self._subscribed.set()
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                if message["channel"] == TOKEN_GENERATION_CHANNEL:
+                    self.generations.pop(message["data"])
+                else:
+                    self.add(message["data"])
+        finally:
+            self._subscribed.clear()
+            self.ready = False
+            # 구독이 끊긴 동안의 세대 변경을 놓쳤을 수 있음
+            self.generations.clear()
+            await pubsub.aclose()
+
+    async def run(self, retry_delay: float = 1.0):
+        """구독과 주기적 재구성을 함께 실행합니다. app_lifespan에서 백그라운드 태스크로 실행합니다."""
+        while True:
+            listener = asyncio.create_task(self.listen())
+            try:
+                # 구독을 먼저 완료해야 재구성과 구독 사이에 들어온 폐기를 놓치지 않음
+                subscribed = asyncio.create_task(self._subscribed.wait())
+                await asyncio.wait({listener, subscribed}, return_when=asyncio.FIRST_COMPLETED)
+                subscribed.cancel()
+                while not listener.done():
+                    await self.rebuild()
+                    self.ready = True
+                    await asyncio.wait({listener}, timeout=self.rebuild_interval)
+                listener.result()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"토큰 폐기 필터 동기화 오류: {str(e)}")
+                await asyncio.sleep(retry_delay)
+            finally:
+                self.ready = False
+                listener.cancel()
+                await asyncio.gather(listener, return_exceptions=True)
+
+
+revocation_filter = RevocationFilter(
+    redis_client,
+    capacity=settings.REVOCATION_FILTER_CAPACITY,
+    error_rate=settings.REVOCATION_FILTER_ERROR_RATE,
+    rebuild_interval=settings.REVOCATION_FILTER_REBUILD_SECONDS,
+    generation_ttl=settings.TOKEN_GENERATION_CACHE_TTL_SECONDS,
+)
@@ -1,13 +1,79 @@
 from asyncio.log import logger
+from enum import Enum
 import secrets
-import aioredis
-from redis import Redis
+import time
 import redis
+from redis.asyncio import Redis
+
+from src.main.core.auth.jwt import get_token_expiry, token_digest
+from src.main.core.config import settings
+from src.main.core.metrics import REDIS_COMMAND_SECONDS, observe_block, observe_latency
+from src.main.domains.user.repository.revocation_filter import (
+    LEGACY_BLACKLIST_KEY,
+    REVOCATION_CHANNEL,
+    REVOKED_TOKEN_PREFIX,
+    TOKEN_GENERATION_CHANNEL,
+    RevocationFilter,
+    revocation_filter as default_revocation_filter
+)
+
+# Refresh 토큰 교체 스크립트
+# KEYS: 저장된 refresh 토큰, 유예 기간 재사용 해시(이전 토큰 다이제스트 → 새 토큰), 이전 토큰 폐기 키
+# ARGV: 이전 토큰, 새 토큰, 새 토큰 TTL, 유예 기간, 이전 토큰 폐기 TTL, 이전 토큰 다이제스트, 폐기 채널
+# 유예 기간 재사용은 발급된 새 토큰이 아직 저장된 토큰일 때만 허용 (로그아웃, 전체 폐기 후에는 거부)
+ROTATE_REFRESH_TOKEN_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    if tonumber(ARGV[4]) > 0 then
+        redis.call('HSET', KEYS[2], ARGV[6], ARGV[2])
+        redis.call('EXPIRE', KEYS[2], ARGV[4])
+    end
+    if tonumber(ARGV[5]) > 0 then
+        redis.call('SET', KEYS[3], 1, 'EX', ARGV[5])
+        redis.call('PUBLISH', ARGV[7], ARGV[6])
+    end
+    return {'rotated', ARGV[2]}
+end
+local replacement = redis.call('HGET', KEYS[2], ARGV[6])
+if replacement and replacement == current then
+    return {'reused', replacement}
+end
+return {'mismatch'}
+"""
+
+# 로컬 Bloom 필터/세대 캐시로 답하는 메서드는 Redis를 실제로 호출할 때만 측정
+_BLACKLIST_REDIS_SECONDS = REDIS_COMMAND_SECONDS.labels("is_token_blacklisted")
+_GENERATION_REDIS_SECONDS = REDIS_COMMAND_SECONDS.labels("get_token_generation")
+
+class RotationStatus(str, Enum):
+    ROTATED = "rotated"     # 저장된 토큰과 일치하여 새 토큰으로 교체됨
+    REUSED = "reused"       # 유예 기간 내 동시 요청: 이미 교체된 새 토큰을 재사용
+    MISMATCH = "mismatch"   # 저장된 토큰과 불일치 (폐기되었거나 재사용 공격)
 
 class TokenRepository:
-    def __init__(self, redis_client: aioredis.Redis):
+    def __init__(self, redis_client: Redis, revocation_filter: RevocationFilter | None = None):
         self.redis_client = redis_client
+        self.revocation_filter = revocation_filter or default_revocation_filter
+        self._rotate_script = redis_client.register_script(ROTATE_REFRESH_TOKEN_SCRIPT)
 
+    @staticmethod
+    def _revoked_key(token: str) -> str:
+        return f"{REVOKED_TOKEN_PREFIX}{token_digest(token)}"
+
+    @staticmethod
+    def _rotated_key(user_id: str) -> str:
+        return f"user:{user_id}:refresh_token:rotated"
+
+    @staticmethod
+    def _remaining_lifetime(token: str) -> int:
+        """토큰의 남은 수명(초). exp를 읽을 수 없으면 refresh 토큰 최대 수명을 사용합니다."""
+        expires_at = get_token_expiry(token)
+        if expires_at is None:
+            return settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+        return int(expires_at - time.time())
+
+    @observe_latency(REDIS_COMMAND_SECONDS, span_prefix="redis")
     async def store_refresh_token(self, user_id: str, token: str, expire_time: int):
         """refresh 토큰 저장"""
         key = f"user:{user_id}:refresh_token"
@@ -17,39 +83,189 @@ class TokenRepository:
         else:
             logger.error(f"유저 ID {user_id}가 refresh 토큰을 저장하는데 실패했습니다.")
 
+    @observe_latency(REDIS_COMMAND_SECONDS, span_prefix="redis")
     async def get_refresh_token(self, user_id: str) -> str:
         """refresh 토큰 조회"""
         key = f"user:{user_id}:refresh_token"
         return await self.redis_client.get(key)
     
+    @observe_latency(REDIS_COMMAND_SECONDS, span_prefix="redis")
     async def delete_refresh_token(self, user_id: str):
         """refresh 토큰 삭제"""
         try:
-            await self.redis_client.delete(f"user:{user_id}:refresh_token")
+            # 유예 기간 재사용 기록도 함께 지워 로그아웃 직후 이전 토큰으로 재발급받지 못하게 함
+            await self.redis_client.delete(f"user:{user_id}:refresh_token", self._rotated_key(user_id))
             logger.info(f"Refresh token deleted for user: {user_id}")
         except Exception as e:
             logger.error(f"Error deleting refresh token: {str(e)}", exc_info=True)
             raise
 
+    @observe_latency(REDIS_COMMAND_SECONDS, span_prefix="redis")
+    async def rotate_refresh_token(
+        self,
+        user_id: str,
+        old_token: str,
+        new_token: str,
+        expire_time: int,
+        grace_seconds: int
+    ) -> tuple[RotationStatus, str | None]:
+        """
+        저장된 refresh 토큰 비교, 새 토큰 저장, 이전 토큰 폐기를 한 번의 원자적 스크립트로 처리합니다.
+
+        교체 직후 grace_seconds 동안 같은 이전 토큰으로 들어온 요청은 REUSED와 함께 이미 발급된 새 토큰을 받습니다.
+        grace_seconds가 0 이하면 유예 기간 없이 교체합니다.
+
+        :return: (교체 결과, 클라이언트에 내려줄 refresh 토큰)
+        """
+        digest = token_digest(old_token)
+        result = await self._rotate_script(
+            keys=[
+                f"user:{user_id}:refresh_token",
+                self._rotated_key(user_id),
+                f"{REVOKED_TOKEN_PREFIX}{digest}",
+            ],
+            args=[
+                old_token,
+                new_token,
+                expire_time,
+                grace_seconds,
+                max(self._remaining_lifetime(old_token), 0),
+                digest,
+                REVOCATION_CHANNEL,
+            ]
+        )
+        status = RotationStatus(result[0])
+        if status == RotationStatus.ROTATED:
+            self.revocation_filter.add(digest)
+        logger.info(f"유저 ID {user_id} refresh 토큰 교체 결과: {status.value}")
+        return status, result[1] if len(result) > 1 else None
+
     async def is_token_blacklisted(self, token: str) -> bool:
         """Check if a token is blacklisted"""
+        digest = token_digest(token)
+        # 로컬 Bloom 필터에 없으면 폐기되지 않은 토큰 (Redis 조회 생략)
+        if not self.revocation_filter.might_contain(digest):
+            return False
+
         try:
-            result = await self.redis_client.sismember("token_blacklist", token)
-            logger.info(f"Token blacklist check result: {result}")
-            return result
+            with observe_block(_BLACKLIST_REDIS_SECONDS, "redis.is_token_blacklisted"):
+                if not self.revocation_filter.legacy_blacklist:
+                    result = await self.redis_client.exists(f"{REVOKED_TOKEN_PREFIX}{digest}")
+                else:
+                    # 마이그레이션 스크립트가 끝나기 전에는 레거시 Set에 남은 폐기 토큰도 확인
+                    async with self.redis_client.pipeline(transaction=False) as pipe:
+                        pipe.exists(f"{REVOKED_TOKEN_PREFIX}{digest}")
+                        pipe.sismember(LEGACY_BLACKLIST_KEY, token)
+                        revoked, legacy_revoked = await pipe.execute()
+                    result = revoked or legacy_revoked
+            logger.debug(f"Token blacklist check result: {result}")
+            return bool(result)
         except Exception as e:
             logger.error(f"Error checking token blacklist: {str(e)}")
             return False  # 오류 발생 시 기본적으로 토큰이 유효하다고 가정
     
+    @observe_latency(REDIS_COMMAND_SECONDS, span_prefix="redis")
     async def blacklist_token(self, token: str):
-        """Add a blacklisted token"""
+        """토큰 폐기. 토큰 다이제스트 키를 토큰의 남은 수명만큼만 유지하고 다른 워커에 전파합니다."""
+        ttl = self._remaining_lifetime(token)
+        if ttl <= 0:
+            # 이미 만료된 토큰은 검증 단계에서 거부되므로 저장할 필요 없음
+            return
+
+        digest = token_digest(token)
         try:
-            await self.redis_client.sadd("token_blacklist", token)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.setex(f"{REVOKED_TOKEN_PREFIX}{digest}", ttl, 1)
+                pipe.publish(REVOCATION_CHANNEL, digest)
+                await pipe.execute()
+            self.revocation_filter.add(digest)
             logger.info(f"Token blacklisted: {token[:10]}...")
         except Exception as e:
             logger.error(f"Error blacklisting token: {str(e)}", exc_info=True)
             raise
 
+    async def get_token_generation(self, user_id: str, cached: bool = True) -> int:
+        """
+        유저의 현재 토큰 세대.
+
+        :param cached: True면 로컬 캐시를 먼저 확인합니다. 토큰 발급 시에는 False로 Redis 값을 직접 읽습니다.
+        """
+        user_id = str(user_id)
+        generation = self.revocation_filter.generations.get(user_id) if cached else None
+        if generation is None:
+            with observe_block(_GENERATION_REDIS_SECONDS, "redis.get_token_generation"):
+                generation = int(await self.redis_client.get(f"user:{user_id}:token_generation") or 0)
+            self.revocation_filter.generations.set(user_id, generation)
+        return generation
+
+    @observe_latency(REDIS_COMMAND_SECONDS, span_prefix="redis")
+    async def revoke_all_tokens(self, user_id: str) -> int:
+        """
+        유저 토큰 세대를 올려 지금까지 발급된 모든 토큰을 한 번에 무효화합니다.
+
+        :return: 새 토큰 세대
+        """
+        user_id = str(user_id)
+        try:
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.incr(f"user:{user_id}:token_generation")
+                pipe.delete(f"user:{user_id}:refresh_token", self._rotated_key(user_id))
+                pipe.publish(TOKEN_GENERATION_CHANNEL, user_id)
+                generation, *_ = await pipe.execute()
+            self.revocation_filter.generations.pop(user_id)
+            logger.info(f"유저 ID {user_id}의 모든 토큰을 폐기했습니다. 새 세대: {generation}")
+            return generation
+        except Exception as e:
+            logger.error(f"Error revoking all tokens: {str(e)}", exc_info=True)
+            raise
+
+    async def is_token_revoked(self, token: str, payload: dict) -> bool:
+        """개별 폐기(블랙리스트)와 유저 토큰 세대를 모두 확인합니다."""
+        if await self.is_token_blacklisted(token):
+            return True
+        return await self.is_generation_revoked(payload)
+
+    async def is_generation_revoked(self, payload: dict) -> bool:
+        """토큰의 세대(gen)가 유저의 현재 토큰 세대보다 오래되었는지 확인합니다."""
+        user_id = payload.get("uid")
+        if user_id is None:
+            # 세대 클레임 도입 이전에 발급된 토큰
+            return False
+        try:
+            return payload.get("gen", 0) < await self.get_token_generation(user_id)
+        except Exception as e:
+            logger.error(f"Error checking token generation: {str(e)}")
+            return False  # 블랙리스트 확인과 동일하게 오류 시 토큰이 유효하다고 가정
+
+    async def migrate_legacy_blacklist(self, batch_size: int = 500) -> tuple[int, int]:
+        """
+        전역 블랙리스트 Set의 토큰을 토큰별 만료 키로 옮기고 Set을 비웁니다.
+
+        처리한 배치만 Set에서 제거하므로 중간에 중단되어도 다시 실행하면 이어서 진행됩니다.
+
+        :return: (이전된 토큰 수, 이미 만료되어 버린 토큰 수)
+        """
+        migrated = skipped = 0
+        while True:
+            tokens = await self.redis_client.srandmember(LEGACY_BLACKLIST_KEY, batch_size)
+            if not tokens:
+                break
+
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for token in tokens:
+                    ttl = self._remaining_lifetime(token)
+                    if ttl > 0:
+                        pipe.setex(self._revoked_key(token), ttl, 1)
+                        migrated += 1
+                    else:
+                        skipped += 1
+                pipe.srem(LEGACY_BLACKLIST_KEY, *tokens)
+                await pipe.execute()
+
+        logger.info(f"레거시 블랙리스트 마이그레이션 완료: 이전 {migrated}건, 만료 제외 {skipped}건")
+        return migrated, skipped
+
+    @observe_latency(REDIS_COMMAND_SECONDS, span_prefix="redis")
     async def store_oauth_state(self, provider: str) -> str:
         try:
             state = secrets.token_urlsafe(32)
@@ -60,13 +276,16 @@ class TokenRepository:
             logger.error(f"store_oauth_state 메서드에서 Redis 에러 발생: {str(e)}")
             raise
 
-    async def verify_oauth_state(self, state: str, provider: str) -> bool:
-        stored_provider = await self.redis_client.get(f"oauth_state:{state}")
+    @observe_latency(REDIS_COMMAND_SECONDS, span_prefix="redis")
+    async def consume_oauth_state(self, state: str, provider: str) -> bool:
+        """
+        OAuth state를 한 번의 원자적 GETDEL로 조회와 동시에 삭제합니다.
+
+        같은 state로 다시 호출하면 항상 False를 반환하므로 콜백 재전송(replay)이 차단됩니다.
+        """
+        stored_provider = await self.redis_client.getdel(f"oauth_state:{state}")
         return stored_provider == provider
     
+    @observe_latency(REDIS_COMMAND_SECONDS, span_prefix="redis")
     async def get_oauth_state(self, state: str) -> str:
         return await self.redis_client.get(f"oauth_state:{state}")
-
-    async def delete_oauth_state(self, state: str):
-        await self.redis_client.delete(f"oauth_state:{state}")
-            
\ No newline at end of file
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import logging
+import math
+import secrets
+import time
+from datetime import datetime
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import DateTime
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.main.core.cache import TTLCache
+from src.main.core.config import settings
+from src.main.db.database import redis_client
+from src.main.domains.user.models.user import User
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_CHANNEL = "user_cache:invalidate"
+# 캐시(Redis)에 남기지 않는 컬럼. 캐시에서 만든 객체에서는 로드되지 않은 상태로 남습니다.
+EXCLUDED_COLUMNS = frozenset({"password"})
+
+
+class UserCache:
+    """
+    유저 레코드 2단계 읽기 캐시입니다. (프로세스 내 LRU → Redis → DB)
+
+    쓰기 시 invalidate()로 두 단계를 모두 비우고, Redis pub/sub으로 다른 워커의 로컬 캐시도 무효화합니다.
+    로컬 캐시 TTL은 Redis TTL보다 짧게 두어 무효화 메시지를 놓친 경우에도 오래된 값이 오래 남지 않게 합니다.
+    레플리카에서 읽은 레코드는 복제 지연만큼 오래되었을 수 있으므로 replica_ttl초 동안만 보관합니다.
+    """
+
+    def __init__(self, redis_client: Redis, ttl: int, local_ttl: float, maxsize: int, replica_ttl: float | None = None):
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self.replica_ttl = ttl if replica_ttl is None else min(replica_ttl, ttl)
+        self.local = TTLCache(maxsize=maxsize, default_ttl=local_ttl)
+        self.instance_id = secrets.token_hex(8)
+
+    @staticmethod
+    def _key(field: str, value) -> str:
+        return f"user_cache:{field}:{value}"
+
+    @staticmethod
+    def to_dict(user: User) -> dict:
+        data = {}
+        for column in User.__table__.columns:
+            if column.key in EXCLUDED_COLUMNS:
+                continue
+            value = getattr(user, column.key)
+            data[column.key] = value.isoformat() if isinstance(value, datetime) else value
+        return data
+
+    @staticmethod
+    def to_model(data: dict) -> User:
+        values = dict(data)
+        for column in User.__table__.columns:
+            if isinstance(column.type, DateTime) and values.get(column.key):
+                values[column.key] = datetime.fromisoformat(values[column.key])
+        user = User(**values)
+        make_transient_to_detached(user)
+        return user
+
+    async def get(self, field: str, value) -> dict | None:
+        key = self._key(field, value)
+        data = self.local.get(key)
+        if data is not None:
+            return data
+
+        try:
+            raw = await self.redis_client.get(key)
+        except RedisError as e:
+            logger.warning(f"유저 캐시 조회 실패, DB로 대체합니다: {str(e)}")
+            return None
+
+        if raw is None:
+            return None
+
+        data = json.loads(raw)
+        self.local.set(key, data)
+        return data
+
+    async def set(self, user: User, from_replica: bool = False):
+        data = self.to_dict(user)
+        keys = [self._key("id", user.id), self._key("email", user.email)]
+        raw = json.dumps(data)
+        ttl = self.replica_ttl if from_replica else self.ttl
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.setex(key, max(1, math.ceil(ttl)), raw)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"유저 캐시 저장 실패: {str(e)}")
+            return
+
+        expires_at = time.time() + min(self.local_ttl, ttl)
+        for key in keys:
+            self.local.set(key, data, expires_at)
+
+    async def invalidate(self, user_id: int | None = None, email: str | None = None):
+        keys = []
+        if user_id is not None:
+            keys.append(self._key("id", user_id))
+        if email is not None:
+            keys.append(self._key("email", email))
+        await self._invalidate_keys(keys)
+
+    async def invalidate_many(self, users: list[tuple[int, str]]):
+        """(id, email) 목록의 캐시를 한 번의 파이프라인으로 무효화합니다."""
+        await self._invalidate_keys(
+            [key for user_id, email in users for key in (self._key("id", user_id), self._key("email", email))]
+        )
+
+    async def _invalidate_keys(self, keys: list[str]):
+        if not keys:
+            return
+
+        for key in keys:
+            self.local.pop(key)
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.delete(*keys)
+                pipe.publish(USER_CACHE_CHANNEL, json.dumps({"origin": self.instance_id, "keys": keys}))
+                await pipe.execute()
+        except RedisError as e:
+            logger.error(f"유저 캐시 무효화 실패: {str(e)}")
+
+    async def listen(self, retry_delay: float = 1.0):
+        """다른 워커의 무효화 메시지를 구독하여 로컬 캐시를 비웁니다. app_lifespan에서 백그라운드 태스크로 실행합니다."""
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(USER_CACHE_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    payload = json.loads(message["data"])
+                    if payload.get("origin") == self.instance_id:
+                        continue
+                    for key in payload.get("keys", []):
+                        self.local.pop(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 구독이 끊긴 동안의 무효화 메시지를 놓쳤을 수 있으므로 로컬 캐시를 비움
+                logger.error(f"유저 캐시 무효화 구독 오류: {str(e)}")
+                self.local.clear()
+                await asyncio.sleep(retry_delay)
+            finally:
+                await pubsub.aclose()
+
+
+user_cache = UserCache(
+    redis_client,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+    local_ttl=settings.USER_CACHE_LOCAL_TTL_SECONDS,
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    replica_ttl=settings.DB_REPLICA_MAX_LAG_SECONDS,
+)
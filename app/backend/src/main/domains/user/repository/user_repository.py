@@ -1,23 +1,35 @@
 from asyncio.log import logger
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.main.core.metrics import DB_QUERY_SECONDS, observe_block, observe_latency
+from src.main.db.deps import run_after_commit
+from src.main.db.routing import REPLICA_READ, has_writes, last_read_from_replica
 from src.main.domains.user.schemas.user import UserCreate
 from src.main.domains.user.models.user import User
+from src.main.domains.user.repository.user_cache import UserCache, user_cache
+
+# 로컬/Redis 캐시 적중은 제외하고 실제 SELECT만 측정
+_SELECT_SECONDS = {
+    "id": DB_QUERY_SECONDS.labels("get_by_id"),
+    "email": DB_QUERY_SECONDS.labels("get_by_email"),
+}
 
 class UserRepository:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: UserCache | None = None):
         self.db = db
+        self.cache = cache or user_cache
 
     async def get_by_id(self, user_id: int) -> User | None:
-        result = await self.db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one_or_none()
+        return await self._get_cached("id", user_id, User.id == user_id)
     
     async def get_by_email(self, email: str) -> User | None:
-        result = await self.db.execute(select(User).where(User.email == email))
-        return result.scalar_one_or_none()
+        return await self._get_cached("email", email, User.email == email)
     
     
+    @observe_latency(DB_QUERY_SECONDS, span_prefix="db")
     async def create_user(self, user_create: UserCreate) -> User:
         if isinstance(user_create, dict):
             user_data = user_create
@@ -26,11 +38,79 @@ class UserRepository:
         user = User(**user_data)
         self.db.add(user)
         await self.db.flush()
+        self.invalidate_cache(user)
         return user
     
     async def get_or_create_user(self, user_create: UserCreate) -> User:
-        user = await self.get_by_email(user_create.email)
-        if not user:
-            user = await self.create_user(user_create)
+        return await self.upsert_user(user_create)
+
+    @observe_latency(DB_QUERY_SECONDS, span_prefix="db")
+    async def upsert_user(self, user_create: UserCreate | dict) -> User:
+        """
+        이메일 기준으로 유저를 생성하거나, 이미 있으면 last_login만 갱신합니다.
+
+        INSERT ... ON CONFLICT (email) DO UPDATE ... RETURNING 한 문장으로 처리하므로
+        동시에 첫 로그인이 들어와도 unique 위반이 발생하지 않습니다.
+        """
+        if isinstance(user_create, dict):
+            user_data = user_create
+        else:
+            user_data = user_create.model_dump(exclude_unset=True)
+
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            insert = postgresql.insert
+        elif dialect == "sqlite":
+            insert = sqlite.insert
+        else:
+            # ON CONFLICT를 지원하지 않는 DB는 조회 후 생성
+            user = await self.get_by_email(user_data["email"])
+            if user is None:
+                user = await self.create_user({**user_data, "last_login": func.now()})
+                await self.db.refresh(user)
+                return user
+            user.last_login = func.now()
+            await self.db.flush()
+            await self.db.refresh(user)
+            self.invalidate_cache(user)
+            return user
+
+        stmt = (
+            insert(User)
+            .values(**user_data, last_login=func.now())
+            .on_conflict_do_update(index_elements=[User.email], set_={"last_login": func.now()})
+            .returning(User)
+        )
+        result = await self.db.execute(stmt, execution_options={"populate_existing": True})
+        user = result.scalar_one()
+        self.invalidate_cache(user)
+        return user
+
+    def invalidate_cache(self, user: User):
+        """
+        유저를 변경하는 모든 쓰기 경로는 flush 후 이 메서드로 캐시 무효화를 등록해야 합니다.
+
+        무효화는 커밋 직후에 실행합니다. 트랜잭션이 열려 있는 동안 무효화하면 다른 요청이
+        커밋 전의 행을 다시 캐시에 채워 TTL 동안 오래된 값이 남을 수 있기 때문입니다.
+        """
+        user_id, email = user.id, user.email
+        run_after_commit(self.db, lambda: self.cache.invalidate(user_id=user_id, email=email))
+
+    async def _get_cached(self, field: str, value, criterion) -> User | None:
+        # 쓰기가 있었던 세션은 커밋 전 값을 읽고 쓸 수 있으므로 캐시를 거치지 않음
+        use_cache = not has_writes(self.db)
+        if use_cache:
+            data = await self.cache.get(field, value)
+            if data is not None:
+                # 캐시된 레코드를 SELECT 없이 현재 세션에 연결
+                return await self.db.merge(self.cache.to_model(data), load=False)
+
+        # 읽기 전용 조회는 레플리카로 (같은 세션에서 쓰기가 있었으면 프라이머리)
+        with observe_block(_SELECT_SECONDS[field], f"db.get_by_{field}"):
+            result = await self.db.execute(select(User).where(criterion).execution_options(**REPLICA_READ))
+        user = result.scalar_one_or_none()
+        # 레플리카 결과는 복제 지연만큼 오래되었을 수 있으므로 짧은 TTL로만 캐시
+        if user is not None and use_cache:
+            await self.cache.set(user, from_replica=last_read_from_replica(self.db))
         return user
-    
\ No newline at end of file
+    
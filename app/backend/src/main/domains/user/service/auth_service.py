@@ -1,4 +1,3 @@
-from hmac import compare_digest
 import json
 import logging
 import secrets
@@ -12,15 +11,19 @@ import urllib
 from src.main.domains.user.schemas.user.user_create import UserCreate
 from src.main.domains.user.service.user_service import UserService
 from src.main.domains.user.repository.user_repository import UserRepository
+from src.main.domains.user.repository.login_activity import login_activity
+from src.main.db.deps import run_after_commit
 from src.main.domains.user.schemas.user.user_response import UserResponse
 from src.main.domains.user.auth.factory import SocialLoginFactory
-from src.main.domains.user.repository.token_repository import TokenRepository
+from src.main.domains.user.auth.http_client import provider_http_clients
+from src.main.domains.user.repository.token_repository import RotationStatus, TokenRepository
 
 from src.main.core.config import settings
 from src.main.core.exceptions import (
     AuthenticationError,
     InternalServerError, 
     NotFoundError,
+    ServiceUnavailableError,
     ValidationError
 )
 from src.main.core.auth.jwt import (
@@ -52,26 +55,33 @@ class AuthService:
     async def handle_oauth_callback(self, request: Request, provider: str) -> JSONResponse:
         code = request.query_params.get('code')
         state = request.query_params.get('state')
-        logger.debug(f"전달 받은 state: {state}, provider: {provider}, code: {code}")
+        logger.debug(f"OAuth 콜백 처리 중... provider: {provider}")
         
         if not code or not state:
             raise AuthenticationError("코드 또는 상태 매개 변수가 누락되었습니다.")
 
-        # Redis에서 상태 검증
-        if not await self.token_repository.verify_oauth_state(state, provider):
+        # Redis에서 상태 검증 및 삭제 (한 번의 GETDEL, 재사용 방지)
+        if not await self.token_repository.consume_oauth_state(state, provider):
             raise ValidationError("유효하지 않은 상태 매개변수입니다.")
         
         try:
             social_login = SocialLoginFactory.get_social_login(provider, self.token_repository)
-            user_create = await social_login.get_user_info(code, state)
+            # 제공자 호출에 데드라인, 동시 호출 제한, 서킷 브레이커 적용
+            user_create = await provider_http_clients.breaker(provider).call(
+                social_login.get_user_info, code, state
+            )
             logger.debug(f"생성된 UserCreate 객체: {user_create}")
             
             user = await self.user_service.get_or_create_user(user_create)
+            # last_login은 upsert에서 이미 갱신됨, 이벤트만 배치로 기록 (새 유저 행이 커밋된 뒤)
+            run_after_commit(
+                self.user_service.db,
+                lambda: login_activity.record(user.id, "login", provider, update_last_login=False)
+            )
 
-            access_token = create_access_token(data={"sub": user.email})
-            refresh_token = create_refresh_token(data={"sub": str(user.id)})
+            access_token, refresh_token = await self._create_tokens(user)
 
-            logger.info(f"Generated tokens - Access: {access_token[:10]}..., Refresh: {refresh_token[:10]}...")
+            logger.info(f"유저 ID {user.id} 토큰 발급 완료 (provider: {provider})")
 
             # Refresh token 저장
             await self.token_repository.store_refresh_token(
@@ -80,9 +90,6 @@ class AuthService:
                 settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
             )
 
-            # 사용된 OAuth 상태 삭제
-            await self.token_repository.delete_oauth_state(state)
-
             user_data = UserResponse.from_orm(user).model_dump()
             encoded_user_data = urllib.parse.quote(json.dumps(user_data))
             
@@ -111,12 +118,15 @@ class AuthService:
                 path="/"
             )
 
-            logger.info(f"사용자 정보와 토큰을 포함한 응답을 전송합니다: {response.body}")
+            logger.debug("사용자 정보와 토큰을 포함한 응답을 전송합니다.")
             return response
 
         except AuthenticationError as e:
             logger.exception(f"인증 오류: {str(e)}")
             raise
+        except ServiceUnavailableError as e:
+            logger.warning(f"소셜 로그인 제공자 사용 불가: {str(e)}")
+            raise
         except Exception as e:
             logger.exception(f"사용자 정보 획득 중 예상치 못한 오류: {str(e)}")
             raise AuthenticationError(f"사용자 정보 획득 중 오류 발생: {str(e)}")
@@ -132,38 +142,34 @@ class AuthService:
             payload = verify_token(old_refresh_token)
             user_id = payload.get("sub")
 
-            # 저장된 refresh token과 비교
-            stored_token = await self.token_repository.get_refresh_token(str(user_id))
-            if not compare_digest(stored_token, old_refresh_token):
-                raise AuthenticationError("Refresh Token이 일치하지 않습니다.")
+            # 유저 토큰 세대가 바뀌었으면 (전체 세션 폐기) 거부
+            # 개별 폐기 여부는 교체 스크립트의 저장 토큰 비교로 확인 (유예 기간 내 동시 요청 허용)
+            if await self.token_repository.is_generation_revoked(payload):
+                raise AuthenticationError("폐기된 Refresh Token입니다.")
 
             user = await self.user_repository.get_by_id(int(user_id))
             if not user:
                 raise NotFoundError("유저를 찾을 수 없습니다.")
             
-            # 새 access token 생성
-            new_access_token = create_access_token(
-                data={"sub": user.email},
-                expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-            )
+            # 새 access token, refresh token 생성
+            new_access_token, new_refresh_token = await self._create_tokens(user)
 
-            # 새 refresh token 생성
-            new_refresh_token = create_refresh_token(
-                data={"sub": str(user.id)},
-                expires_delta=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+            # 저장된 토큰 비교, 새 Refresh 토큰 저장, 이전 토큰 폐기를 한 번에 처리
+            status, refresh_token = await self.token_repository.rotate_refresh_token(
+                str(user.id),
+                old_refresh_token,
+                new_refresh_token,
+                settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+                settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS
             )
+            if status == RotationStatus.MISMATCH:
+                raise AuthenticationError("Refresh Token이 일치하지 않습니다.")
 
-            # 새 Refresh 토큰 저장 및 이전 토큰 블랙리스트 처리
-            await self.token_repository.store_refresh_token(
-                str(user.id), 
-                new_refresh_token, 
-                settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
-            )
-            await self.token_repository.blacklist_token(old_refresh_token)
+            login_activity.record(user.id, "refresh")
 
             return {
                 "access_token": new_access_token,
-                "refresh_token": new_refresh_token,
+                "refresh_token": refresh_token,
                 "token_type": "bearer"
             }
         except AuthenticationError as e:
@@ -176,6 +182,29 @@ class AuthService:
             logger.exception(f"Unexpected error in refresh_token: {str(e)}")
             raise InternalServerError(f"예상치 못한 에러 발생: {str(e)}")
 
+    async def revoke_all_sessions(self, user_id: str):
+        """유저의 모든 access/refresh 토큰을 한 번에 무효화합니다. (강제 로그아웃, 계정 탈취 대응 등)"""
+        try:
+            await self.token_repository.revoke_all_tokens(user_id)
+            logger.info(f"유저 ID가 {user_id} 인 유저의 모든 세션을 폐기했습니다.")
+        except Exception as e:
+            logger.error(f"전체 세션 폐기 도중 에러 발생: {str(e)}", exc_info=True)
+            raise InternalServerError(f"전체 세션 폐기 중 예상치 못한 에러 발생: {str(e)}")
+
+    async def _create_tokens(self, user) -> tuple[str, str]:
+        """현재 유저 토큰 세대(gen)를 담은 access/refresh 토큰 쌍을 생성합니다."""
+        generation = await self.token_repository.get_token_generation(str(user.id), cached=False)
+        claims = {"uid": user.id, "gen": generation}
+        access_token = create_access_token(
+            data={"sub": user.email, **claims},
+            expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        )
+        refresh_token = create_refresh_token(
+            data={"sub": str(user.id), **claims},
+            expires_delta=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        )
+        return access_token, refresh_token
+
     async def logout(self, token: str, user_id: str):
         try:
             logger.info(f"Attempting to logout user: {user_id}")
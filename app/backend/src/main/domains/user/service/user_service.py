@@ -25,22 +25,21 @@ class UserService:
         return user
 
     async def get_or_create_user(self, user_create: UserCreate) -> UserResponse:
-        async with self.db.begin():
-            try:
-                prepared_data = self._prepare_user_data(user_create)
-                user = await self.user_repository.get_by_email(prepared_data['email'])
-                if not user:
-                    user = await self.user_repository.create_user(prepared_data)
-                return UserResponse.from_orm(user)
-            except SQLAlchemyError as e:
-                logger.error(f"Database error: {str(e)}")
-                raise HTTPException(status_code=500, detail="데이터베이스 오류가 발생했습니다.")
-            except PydanticValidationError as e:
-                logger.error(f"Data validation error: {str(e)}")
-                raise HTTPException(status_code=422, detail="데이터 검증 오류가 발생했습니다.")
-            except Exception as e:
-                logger.exception(f"Unexpected error: {str(e)}")
-                raise HTTPException(status_code=500, detail=f"예기치 않은 오류가 발생했습니다: {str(e)}")
+        # 커밋/롤백은 요청 단위 세션(get_db)에서 한 번에 처리
+        try:
+            prepared_data = self._prepare_user_data(user_create)
+            # 생성 또는 last_login 갱신을 한 문장으로 처리
+            user = await self.user_repository.upsert_user(prepared_data)
+            return UserResponse.from_orm(user)
+        except SQLAlchemyError as e:
+            logger.error(f"Database error: {str(e)}")
+            raise HTTPException(status_code=500, detail="데이터베이스 오류가 발생했습니다.")
+        except PydanticValidationError as e:
+            logger.error(f"Data validation error: {str(e)}")
+            raise HTTPException(status_code=422, detail="데이터 검증 오류가 발생했습니다.")
+        except Exception as e:
+            logger.exception(f"Unexpected error: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"예기치 않은 오류가 발생했습니다: {str(e)}")
     
     def _prepare_user_data(self, user_create: UserCreate) -> dict:
         user_data = user_create.model_dump(exclude_unset=True)
@@ -1,29 +1,52 @@
 import sys
 import os
+import asyncio
 import logging
+import secrets
 
 from fastapi.staticfiles import StaticFiles
 import redis
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from fastapi.routing import APIRoute
 from contextlib import asynccontextmanager
 
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
-from src.main.middleware.auth import auth_middleware
+from src.main.middleware.auth import AuthMiddleware
+from src.main.middleware.metrics import MetricsMiddleware
+from src.main.middleware.tracing import TracingMiddleware
+from src.main.middleware.profiling import ProfilingMiddleware, has_profile_token
+from src.main.core.profiler import RequestProfiler
+from src.main.core.metrics import registry
+from src.main.core.auth.routes import build_public_route_table
 from src.main.core.auth.oauth import setup_oauth
-from src.main.db.database import Base, engine
+from src.main.db.database import engine, replica_set
+from src.main.db.schema import verify_schema_revision
 from src.main.core.config import settings
 from src.main.api.v1.api import api_router
 from src.main.db.database import redis_client
-from src.main.core.exceptions import BaseCustomException, custom_exception_handler
-
-logging.basicConfig(level=logging.INFO)
-logging.getLogger('sqlalchemy.engine').setLevel(logging.DEBUG)
+from src.main.domains.user.repository.user_cache import user_cache
+from src.main.domains.user.repository.revocation_filter import revocation_filter
+from src.main.domains.user.repository.login_activity import login_activity
+from src.main.domains.user.auth.http_client import provider_http_clients
+from src.main.domains.user.auth.providers.google import google_metadata
+from src.main.core.exceptions import (
+    AuthorizationError,
+    BaseCustomException,
+    NotFoundError,
+    custom_exception_handler
+)
+from src.main.core.logging import setup_logging
+from src.main.core.loop_monitor import loop_monitor
+from src.main.core.tracing import TracedJSONResponse, setup_tracing
+
+setup_logging()
 logger = logging.getLogger(__name__)
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -35,6 +58,12 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 async def app_lifespan(app: FastAPI):
     logger.info("애플리케이션 시작 프로세스 시작")
     setup_oauth()
+    provider_http_clients.startup()
+    # OIDC discovery/JWKS를 미리 받아 두어 첫 로그인 요청이 가져오지 않도록 함
+    try:
+        await google_metadata.refresh(provider_http_clients.get("google"))
+    except Exception as e:
+        logger.error(f"구글 OIDC 메타데이터 조회 실패, 백그라운드에서 재시도합니다: {e}")
     # Redis 연결 확인
     try:
         await redis_client.ping()
@@ -46,23 +75,43 @@ async def app_lifespan(app: FastAPI):
     except redis.exceptions.ConnectionError as e:
         logger.error(f"Redis 서버 연결 실패: {e}")
     
-    async with engine.begin() as conn:
-        # 모든 테이블 삭제
-        # logger.info("테이블 삭제 중")
-        # await conn.run_sync(Base.metadata.drop_all)
-        # 모든 테이블 다시 생성
-        logger.info("테이블 생성 중")
-        await conn.run_sync(Base.metadata.create_all)
-
-        # 생성된 테이블 목록 로깅
-        tables = Base.metadata.tables
-        logger.info(f"생성된 테이블: {', '.join(tables.keys())}")
+    # 스키마 변경은 배포 단계의 'alembic upgrade head'로 적용하고, 워커는 리비전만 확인
+    if settings.DB_VERIFY_SCHEMA:
+        await verify_schema_revision(engine)
         
+    # 다른 워커의 유저 캐시 무효화 메시지 구독
+    user_cache_listener = asyncio.create_task(user_cache.listen())
+    # 폐기 토큰 Bloom 필터 동기화 (준비 전까지는 Redis로 직접 확인)
+    revocation_sync = asyncio.create_task(revocation_filter.run())
+    # OIDC 메타데이터 만료 전 백그라운드 갱신
+    oidc_metadata_refresh = asyncio.create_task(google_metadata.run(provider_http_clients.get("google")))
+    # 레플리카 상태/복제 지연 확인 (첫 확인 전에는 프라이머리로 조회)
+    replica_health = asyncio.create_task(replica_set.run(settings.DB_REPLICA_HEALTH_INTERVAL_SECONDS))
+    # last_login, 로그인 이벤트 배치 기록
+    login_activity_flusher = asyncio.create_task(login_activity.run())
+    # 이벤트 루프 지연 측정 및 블로킹 호출 스택 기록
+    loop_lag_monitor = asyncio.create_task(loop_monitor.run()) if settings.LOOP_MONITOR_ENABLED else None
+
     logger.info("애플리케이션 시작 프로세스 완료")
     yield
     # 애플리케이션 종료 시 실행될 로직 (필요한 경우)
     # 애플리케이션 종료 시 실행될 로직
     logger.info("애플리케이션 종료 프로세스 시작")
+
+    background_tasks = [
+        user_cache_listener, revocation_sync, oidc_metadata_refresh, replica_health, login_activity_flusher
+    ]
+    if loop_lag_monitor is not None:
+        background_tasks.append(loop_lag_monitor)
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    # 남은 로그인 기록 저장
+    await login_activity.flush()
+    await replica_set.dispose()
+
+    # 소셜 로그인 HTTP 클라이언트 종료
+    await provider_http_clients.aclose()
     
     # Redis 연결 종료
     try:
@@ -82,6 +131,7 @@ def create_application() -> FastAPI:
         title=settings.PROJECT_NAME,
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         generate_unique_id_function=custom_generate_unique_id,
+        default_response_class=TracedJSONResponse if settings.TRACING_ENABLED else JSONResponse,
     )
 
     app.add_exception_handler(BaseCustomException, custom_exception_handler)
@@ -93,7 +143,10 @@ def create_application() -> FastAPI:
         https_only=False,
         max_age=3600 # 세션 유효기간
     )
-    app.middleware("http")(auth_middleware)
+    app.add_middleware(
+        AuthMiddleware,
+        public_routes=build_public_route_table(api_router, settings.API_V1_STR)
+    )
 
     # Set All CORS enabled origins
     if settings.BACKEND_CORS_ORIGINS:
@@ -107,8 +160,63 @@ def create_application() -> FastAPI:
             allow_headers=["*"]
         )
 
+    # 인증 단계부터 응답 전송까지 요청 하나를 스팬으로 나눠 기록
+    if settings.TRACING_ENABLED:
+        app.add_middleware(TracingMiddleware, tracer=setup_tracing())
+
+    # 토큰 헤더나 샘플링 비율로 선택된 요청만 프로파일링 (꺼져 있으면 등록하지 않음)
+    if settings.PROFILER_ENABLED:
+        profiler = RequestProfiler(
+            settings.PROFILER_DIR or os.path.join(settings.LOG_DIR, "profiles"),
+            interval=settings.PROFILER_INTERVAL_SECONDS,
+            max_concurrent=settings.PROFILER_MAX_CONCURRENT,
+            max_files=settings.PROFILER_MAX_FILES,
+        )
+        app.add_middleware(
+            ProfilingMiddleware,
+            profiler=profiler,
+            token=settings.PROFILER_TOKEN,
+            sample_rate=settings.PROFILER_SAMPLE_RATE,
+        )
+
+    # 가장 바깥에서 모든 미들웨어를 포함한 처리 시간을 측정
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
     app.include_router(api_router, prefix=settings.API_V1_STR)
 
+    # Prometheus 수집 엔드포인트 (정적 파일 마운트보다 먼저 등록, Authorization: Bearer METRICS_TOKEN 필요)
+    if settings.METRICS_ENABLED and settings.METRICS_TOKEN:
+        expected_authorization = f"Bearer {settings.METRICS_TOKEN}".encode()
+
+        @app.get(settings.METRICS_PATH, include_in_schema=False)
+        async def metrics(request: Request):
+            authorization = request.headers.get("authorization", "").encode()
+            if not secrets.compare_digest(authorization, expected_authorization):
+                raise AuthorizationError("메트릭 조회 권한이 없습니다.")
+            return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+    # 프로파일 결과 조회/다운로드 (X-Profile-Token 헤더 필요)
+    if settings.PROFILER_ENABLED:
+        @app.get(settings.PROFILER_PATH, include_in_schema=False)
+        async def list_profiles(request: Request):
+            if not has_profile_token(request.scope, settings.PROFILER_TOKEN):
+                raise AuthorizationError("프로파일 조회 권한이 없습니다.")
+            # 디렉터리 glob/stat은 이벤트 루프 밖에서 실행
+            return {"profiles": await run_in_threadpool(profiler.list_profiles)}
+
+        @app.get(f"{settings.PROFILER_PATH}/{{profile_id}}", include_in_schema=False)
+        async def download_profile(request: Request, profile_id: str):
+            if not has_profile_token(request.scope, settings.PROFILER_TOKEN):
+                raise AuthorizationError("프로파일 조회 권한이 없습니다.")
+            path = profiler.get_path(profile_id)
+            if path is None and profiler.is_pending(profile_id):
+                # X-Profile-Id는 응답 헤더로 먼저 나가고, 파일은 요청이 끝난 뒤 샘플러 스레드가 씀
+                return JSONResponse({"status": "pending"}, status_code=202, headers={"Retry-After": "1"})
+            if path is None:
+                raise NotFoundError("프로파일을 찾을 수 없습니다.")
+            return FileResponse(path, media_type="text/plain", filename=path.name)
+
     # 정적 파일 서빙
     app.mount("/", StaticFiles(directory="/Users/jonghyunjung/VisualStudioProjects/neonadeuli/app/backend/src/test/social-login-test/build", html=True), name="static")
 
@@ -1,71 +1,42 @@
-from asyncio.log import logger
-from fastapi import Request
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from src.main.core.auth.jwt import verify_token
-from src.main.domains.user.dependencies import get_redis_token_manager, get_user_repository
-from src.main.db.deps import get_db
+from src.main.core.auth.context import AuthContext, LazyUser, extract_token
+from src.main.core.auth.routes import PublicRouteTable
+from src.main.core.tracing import span
+from src.main.db.deps import RequestSession
 
-security = HTTPBearer()
 
-async def auth_middleware(request: Request, call_next):
-    logger.info(f"Request path: {request.url.path}")
-    logger.info(f"Cookies: {request.cookies}")
-    logger.info(f"Headers: {request.headers}")
+class AuthMiddleware:
+    """
+    순수 ASGI 인증 미들웨어입니다.
 
-    # 정적 리소스 요청 무시
-    if request.url.path in ['/favicon.ico', '/static']:
-        return await call_next(request)
-    
-    # 토큰 갱신 엔드포인트 미들웨어 통과
-    if request.url.path == "/api/v1/users/token/refresh":
-        return await call_next(request)
-    
-    # 로그인, 콜백 엔드포인트 미들웨어 통과
-    if request.url.path.startswith("/api/v1/users/login") or request.url.path.startswith("/api/v1/users/auth"):
-        return await call_next(request)
-    
-    try:
-        # DB 세션 획득
-        db = await get_db().__anext__()
-        token_manager = get_redis_token_manager()
-        user_repository = get_user_repository(db)
+    Request 객체를 만들지 않고 scope의 경로와 헤더만 읽어, 보호된 라우트에 대해서만
+    요청 단위 인증 컨텍스트(request.state.auth)와 지연 로딩 유저(request.state.user)를 설정합니다.
+    모든 HTTP 요청에 요청 단위 DB 세션(request.state.db)을 두고, 요청이 끝나면 닫습니다.
+    """
 
-        # 토큰 추출
-        token = request.cookies.get("access_token")
-        if not token:
-            auth: HTTPAuthorizationCredentials = await security(request)
-            if auth:
-                token = auth.credentials
-        
-        if token:
-            try:
-                # 토큰 검증
-                payload = verify_token(token)
-                logger.info(f"토큰 인증 성공: {payload}")
-                
-                user_email = payload.get("sub")
-                user = await user_repository.get_by_email(user_email)
-                if user:
-                    request.state.user = user
-                    logger.info(f"User authenticated: {user_email}")
-                else:
-                    logger.warning(f"User not found for email: {user_email}")
-                    request.state.user = None
+    def __init__(self, app: ASGIApp, public_routes: PublicRouteTable):
+        self.app = app
+        self.public_routes = public_routes
 
-                logger.info(f"인증된 유저: {user_email}")
-            except Exception as e:
-                logger.error(f"토큰 인증 실패: {str(e)}")
-                request.state.user = None
-        else:
-            logger.info("access token을 찾을 수 없습니다.")
-            request.state.user = None
-    except Exception as e:
-        logger.error(f"인증 미들웨어 에러: {str(e)}")
-        request.state.user = None
-    finally:
-        if db:
-            await db.close()
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    response = await call_next(request)
-    return response
\ No newline at end of file
+        state = scope.setdefault("state", {})
+        request_session = state["db"] = RequestSession()
+
+        if not self.public_routes.is_public(scope["path"]):
+            with span("auth_middleware.extract_token"):
+                auth_context = AuthContext(extract_token(scope))
+            state["auth"] = auth_context
+            # 유저 조회는 request.state.user 를 실제로 읽는 시점까지 지연
+            state["user"] = LazyUser(auth_context, request_session)
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # get_db를 쓰지 않은 요청(request.state.user만 읽은 경우 등)의 세션 정리
+            with span("auth_middleware.close_session"):
+                await request_session.close()
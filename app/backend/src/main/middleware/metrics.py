@@ -0,0 +1,45 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.main.core.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_IN_FLIGHT
+
+
+class MetricsMiddleware:
+    """
+    순수 ASGI 요청 지표 미들웨어입니다.
+
+    처리 중인 요청 수와, 라우트별(custom_generate_unique_id 이름) 처리 시간을 기록합니다.
+    라우트 이름은 라우팅 후 scope["route"]에서 읽으며, 매칭되지 않은 요청은 "unmatched"로 묶습니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._children = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            route_name = getattr(route, "unique_id", None) or getattr(route, "name", None) or "unmatched"
+            key = (route_name, scope["method"], status_code)
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = HTTP_REQUEST_SECONDS.labels(route_name, scope["method"], str(status_code))
+            child.observe(time.perf_counter() - started)
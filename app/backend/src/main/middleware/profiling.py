@@ -0,0 +1,57 @@
+import random
+import secrets
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.main.core.profiler import RequestProfiler
+
+PROFILE_TOKEN_HEADER = b"x-profile-token"
+
+
+def has_profile_token(scope: Scope, token: str) -> bool:
+    """요청 헤더의 프로파일 토큰이 설정값과 일치하는지 확인합니다. 토큰이 설정되지 않았으면 항상 False입니다."""
+    if not token:
+        return False
+    for name, value in scope.get("headers", ()):
+        if name == PROFILE_TOKEN_HEADER:
+            return secrets.compare_digest(value, token.encode())
+    return False
+
+
+class ProfilingMiddleware:
+    """
+    요청 단위 프로파일링 미들웨어입니다. PROFILER_ENABLED일 때만 등록되므로 꺼져 있으면 비용이 없습니다.
+
+    X-Profile-Token 헤더가 PROFILER_TOKEN과 일치하거나 sample_rate 확률에 걸린 요청만 샘플링하고,
+    결과 id를 X-Profile-Id 응답 헤더로 돌려줍니다. 결과 파일은 요청이 끝난 뒤 샘플러 스레드가 쓰므로
+    그 전에 다운로드하면 202(pending)를 받습니다.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler, token: str, sample_rate: float):
+        self.app = app
+        self.profiler = profiler
+        self.token = token
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not (
+            has_profile_token(scope, self.token) or random.random() < self.sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        session = self.profiler.start(f"{scope['method']}{scope['path']}")
+        if session is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-Id", session.profile_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            session.stop()
@@ -0,0 +1,49 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.main.core.tracing import Span, Tracer, finish_trace, start_trace
+
+
+class TracingMiddleware:
+    """
+    순수 ASGI 요청 트레이싱 미들웨어입니다.
+
+    요청마다 트레이스를 시작해 request.state.trace에 두고, 하위 미들웨어, 저장소, 제공자 호출의
+    스팬이 같은 트레이스에 쌓이게 합니다. 응답 전송(http.response.start ~ 마지막 body)도 스팬으로 남기며,
+    요청이 끝난 뒤 Tracer가 느린 요청 위주로 골라 내보냅니다.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace, tokens = start_trace("http.request", {"method": scope["method"], "path": scope["path"]})
+        scope.setdefault("state", {})["trace"] = trace
+        status_code = 500
+        send_span: Span | None = None
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, send_span
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                send_span = Span("response.send", trace.root.span_id, time.perf_counter())
+                if not trace.add_span(send_span):
+                    send_span = None
+            await send(message)
+            if send_span is not None and message["type"] == "http.response.body" and not message.get("more_body"):
+                send_span.duration = time.perf_counter() - send_span.start
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            finish_trace(trace, tokens)
+            route = scope.get("route")
+            trace.root.attributes["route"] = getattr(route, "unique_id", None) or getattr(route, "name", None) or "unmatched"
+            trace.root.attributes["status"] = status_code
+            self.tracer.finish(trace, status_code)
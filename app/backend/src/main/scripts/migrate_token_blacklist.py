@@ -0,0 +1,23 @@
+"""
+기존 전역 토큰 블랙리스트(token_blacklist Set)를 토큰별 만료 키로 옮기는 일회성 마이그레이션입니다.
+
+app/backend 디렉터리에서 실행합니다. 배포 후에 실행해도 되며, Set이 빌 때까지 앱은 레거시 Set도 함께 확인합니다.
+
+    python -m src.main.scripts.migrate_token_blacklist
+"""
+import asyncio
+
+from src.main.db.database import redis_client
+from src.main.domains.user.repository.token_repository import TokenRepository
+
+
+async def main():
+    try:
+        migrated, skipped = await TokenRepository(redis_client).migrate_legacy_blacklist()
+        print(f"이전된 토큰: {migrated}, 만료되어 제외된 토큰: {skipped}")
+    finally:
+        await redis_client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,48 @@
+import time
+
+import httpx
+import pytest
+
+from src.main.core.auth.oidc import ProviderMetadataCache
+
+DISCOVERY_URL = "https://idp.test/.well-known/openid-configuration"
+
+
+def _stand_in_server(requests: list):
+    # 테스트용 OIDC 제공자: discovery 문서와 JWKS를 max-age와 함께 응답
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/.well-known/openid-configuration":
+            return httpx.Response(
+                200,
+                json={
+                    "issuer": "https://idp.test",
+                    "jwks_uri": "https://idp.test/certs",
+                    "token_endpoint": "https://idp.test/token",
+                },
+                headers={"cache-control": "public, max-age=3600"},
+            )
+        return httpx.Response(200, json={"keys": []}, headers={"cache-control": "public, max-age=600"})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_refresh_loads_discovery_and_jwks():
+    requests = []
+    cache = ProviderMetadataCache(DISCOVERY_URL)
+    assert not cache.ready
+    assert cache.issuers == ()
+    assert cache.endpoint("token_endpoint", "https://fallback/token") == "https://fallback/token"
+
+    async with _stand_in_server(requests) as client:
+        await cache.refresh(client)
+
+    assert requests == ["/.well-known/openid-configuration", "/certs"]
+    assert cache.ready
+    assert cache.jwks == {"keys": []}
+    # iss는 discovery 문서의 issuer로 검증 (스킴 없는 별칭은 구글만 허용)
+    assert cache.issuers == ("https://idp.test",)
+    assert cache.endpoint("token_endpoint", "https://fallback/token") == "https://idp.test/token"
+    # 두 문서 중 짧은 max-age를 따름
+    assert cache.expires_at - time.time() <= 600
@@ -0,0 +1,39 @@
+from fastapi import APIRouter
+
+from src.main.core.auth.routes import PUBLIC_ROUTE, build_public_route_table
+
+
+def _build_router() -> APIRouter:
+    users = APIRouter()
+
+    @users.get("/login/{provider}", openapi_extra=PUBLIC_ROUTE)
+    async def login(provider: str):
+        return {}
+
+    @users.post("/token/refresh", openapi_extra=PUBLIC_ROUTE)
+    async def refresh():
+        return {}
+
+    @users.get("/info")
+    async def info():
+        return {}
+
+    router = APIRouter()
+    router.include_router(users, prefix="/users")
+    return router
+
+
+def test_public_route_table_matches_marked_routes():
+    table = build_public_route_table(_build_router(), "/api/v1")
+
+    assert table.is_public("/api/v1/users/login/google")
+    assert table.is_public("/api/v1/users/token/refresh")
+    assert not table.is_public("/api/v1/users/info")
+    assert not table.is_public("/api/v1/users/token/refresh/extra")
+
+
+def test_paths_outside_api_prefix_are_public():
+    table = build_public_route_table(_build_router(), "/api/v1")
+
+    assert table.is_public("/")
+    assert table.is_public("/static/js/main.js")
@@ -0,0 +1,24 @@
+import hashlib
+
+from src.main.core.bloom import BloomFilter
+
+
+def _digest(i: int) -> str:
+    return hashlib.sha256(str(i).encode()).hexdigest()
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(_digest(i))
+
+    assert all(_digest(i) in bloom for i in range(1000))
+
+
+def test_bloom_filter_false_positive_rate_within_bound():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(_digest(i))
+
+    false_positives = sum(_digest(i) in bloom for i in range(1000, 11000))
+    assert false_positives / 10000 < 0.02
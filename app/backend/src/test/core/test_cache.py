@@ -0,0 +1,42 @@
+import time
+
+from src.main.core.cache import TTLCache
+
+
+def test_cache_hit_and_miss():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", {"sub": "a"}, expires_at=time.time() + 60)
+
+    assert cache.get("a") == {"sub": "a"}
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_expires_entry_at_deadline():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1, expires_at=time.time() + 0.05)
+    time.sleep(0.1)
+
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_skips_already_expired_entry():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1, expires_at=time.time() - 1)
+
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, default_ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
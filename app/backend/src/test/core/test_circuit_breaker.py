@@ -0,0 +1,73 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.main.core.circuit_breaker import CircuitBreaker, CircuitState
+from src.main.core.exceptions import AuthenticationError, ServiceUnavailableError
+from src.main.domains.user.auth.providers.kakao import KakaoLogin
+
+
+async def _slow():
+    await asyncio.sleep(1)
+
+
+async def _ok():
+    return "ok"
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_timeouts_and_recovers():
+    breaker = CircuitBreaker("naver", timeout=0.01, max_concurrency=5, failure_threshold=2, recovery_timeout=0.05)
+
+    for _ in range(2):
+        with pytest.raises(ServiceUnavailableError):
+            await breaker.call(_slow)
+    assert breaker.state == CircuitState.OPEN
+
+    # OPEN 동안은 호출하지 않고 바로 거절
+    with pytest.raises(ServiceUnavailableError):
+        await breaker.call(_ok)
+    assert breaker.stats()["rejections"] == 1
+
+    await asyncio.sleep(0.06)
+    assert await breaker.call(_ok) == "ok"
+    assert breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_breaker_limits_concurrency_and_ignores_client_errors():
+    breaker = CircuitBreaker("kakao", timeout=1, max_concurrency=1, failure_threshold=1)
+
+    async def _bad_code():
+        raise AuthenticationError("invalid code")
+
+    with pytest.raises(AuthenticationError):
+        await breaker.call(_bad_code)
+    assert breaker.state == CircuitState.CLOSED
+
+    slow = asyncio.create_task(breaker.call(asyncio.sleep, 0.05))
+    await asyncio.sleep(0)
+    with pytest.raises(ServiceUnavailableError):
+        await breaker.call(_ok)
+    await slow
+
+
+@pytest.mark.asyncio
+async def test_provider_5xx_responses_open_breaker():
+    breaker = CircuitBreaker("kakao", timeout=1, max_concurrency=5, failure_threshold=3)
+    status_codes = iter([400, 503, 503, 503])
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(next(status_codes)))
+    )
+    kakao = KakaoLogin(None, http_client)
+
+    # 잘못된 code(4xx)는 요청 자체의 문제이므로 실패로 집계하지 않음
+    with pytest.raises(AuthenticationError):
+        await breaker.call(kakao.get_user_info, "code", "state")
+    assert breaker.stats()["failures"] == 0
+
+    for _ in range(3):
+        with pytest.raises(ServiceUnavailableError):
+            await breaker.call(kakao.get_user_info, "code", "state")
+    assert breaker.state == CircuitState.OPEN
@@ -0,0 +1,30 @@
+import logging
+
+from src.main.core.logging import RateLimitFilter, redact
+
+
+def test_redact_hides_tokens_and_cookies():
+    assert redact("cookie: access_token=abc; refresh_token=def") == "cookie: [REDACTED]"
+
+    message = redact("Authorization: Bearer eyJa.eyJb.sig status_code=200 GET /callback?code=xyz&state=st")
+    assert "eyJa" not in message
+    assert "?code=[REDACTED]&state=[REDACTED]" in message
+    assert "status_code=200" in message
+    assert redact("code=xyz&state=st") == "code=[REDACTED]&state=[REDACTED]"
+
+
+def test_redact_keeps_ordinary_code_and_state_text():
+    message = "provider error code: 500, breaker state: open"
+    assert redact(message) == message
+
+
+def test_rate_limit_is_per_logger_and_skips_warnings():
+    rate_limit = RateLimitFilter(rate=0, burst=2)
+
+    def record(name, level=logging.INFO):
+        return logging.LogRecord(name, level, __file__, 1, "msg", None, None)
+
+    assert [rate_limit.filter(record("a")) for _ in range(3)] == [True, True, False]
+    assert rate_limit.filter(record("b"))
+    assert rate_limit.filter(record("a", logging.ERROR))
+    assert rate_limit.suppressed == 1
@@ -0,0 +1,26 @@
+import asyncio
+import time
+
+import pytest
+
+from src.main.core.loop_monitor import LoopMonitor
+
+
+def blocking_call():
+    time.sleep(0.2)
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_is_measured_and_its_stack_captured():
+    monitor = LoopMonitor(interval=0.01, threshold=0.05)
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.05)
+
+    blocking_call()
+    await asyncio.sleep(0.05)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert monitor.max_lag >= 0.15
+    assert len(monitor.captures) == 1
+    assert "blocking_call" in monitor.captures[0]["stack"]
@@ -0,0 +1,35 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.main.core.metrics import Histogram, MetricsRegistry, HTTP_REQUEST_SECONDS
+from src.main.middleware.metrics import MetricsMiddleware
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("test_seconds", "test", ("method",), buckets=(0.1, 1.0)))
+    child = histogram.labels("get_by_id")
+    for value in (0.05, 0.1, 0.5, 2.0):
+        child.observe(value)
+
+    output = registry.render()
+
+    assert 'test_seconds_bucket{method="get_by_id",le="0.1"} 2' in output
+    assert 'test_seconds_bucket{method="get_by_id",le="1.0"} 3' in output
+    assert 'test_seconds_bucket{method="get_by_id",le="+Inf"} 4' in output
+    assert 'test_seconds_count{method="get_by_id"} 4' in output
+
+
+def test_middleware_labels_requests_by_route_unique_id():
+    app = FastAPI(generate_unique_id_function=lambda route: f"users-{route.name}")
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/users/{user_id}")
+    async def get_user(user_id: int):
+        return {}
+
+    client = TestClient(app)
+    client.get("/users/1")
+    client.get("/users/2")
+
+    assert sum(HTTP_REQUEST_SECONDS.labels("users-get_user", "GET", "200").counts) == 2
@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.main.core.profiler import RequestProfiler
+from src.main.middleware.profiling import ProfilingMiddleware
+
+
+def _create_app(profiler: RequestProfiler) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, profiler=profiler, token="secret", sample_rate=0)
+
+    @app.get("/callback")
+    async def slow_callback():
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+        await asyncio.sleep(0.05)
+        return {}
+
+    return app
+
+
+def _wait_for(profiler: RequestProfiler, profile_id: str):
+    for _ in range(100):
+        path = profiler.get_path(profile_id)
+        if path is not None and not profiler.is_pending(profile_id):
+            return path
+        time.sleep(0.01)
+    raise AssertionError("프로파일 파일이 생성되지 않았습니다.")
+
+
+def test_profile_token_captures_collapsed_stacks(tmp_path):
+    profiler = RequestProfiler(str(tmp_path), interval=0.002)
+    client = TestClient(_create_app(profiler))
+
+    response = client.get("/callback", headers={"X-Profile-Token": "secret"})
+    profile_id = response.headers["X-Profile-Id"]
+    # 파일을 쓰기 전까지는 pending으로 보임
+    assert profiler.get_path(profile_id) is not None or profiler.is_pending(profile_id)
+
+    lines = _wait_for(profiler, profile_id).read_text().splitlines()
+    running = [line for line in lines if "slow_callback" in line and not line.rsplit(" ", 1)[0].endswith("[await]")]
+    waiting = [line for line in lines if "slow_callback" in line and line.rsplit(" ", 1)[0].endswith("[await]")]
+    assert running and waiting
+    assert profiler.list_profiles() == [response.headers["X-Profile-Id"]]
+
+
+def test_requests_without_token_are_not_profiled(tmp_path):
+    profiler = RequestProfiler(str(tmp_path), interval=0.002)
+    client = TestClient(_create_app(profiler))
+
+    response = client.get("/callback", headers={"X-Profile-Token": "wrong"})
+
+    assert "X-Profile-Id" not in response.headers
+    assert profiler.list_profiles() == []
@@ -0,0 +1,118 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.main.core.config import settings
+from src.main.core.tracing import (
+    FileCollector,
+    InMemoryCollector,
+    TracedJSONResponse,
+    Tracer,
+    TracingTransport,
+    finish_trace,
+    span,
+    start_trace,
+    traced,
+)
+from src.main.middleware.tracing import TracingMiddleware
+
+
+def _create_app(tracer: Tracer) -> FastAPI:
+    app = FastAPI(default_response_class=TracedJSONResponse)
+    app.add_middleware(TracingMiddleware, tracer=tracer)
+
+    @traced("redis.get_refresh_token")
+    async def fake_redis_call():
+        await asyncio.sleep(0)
+
+    provider_client = httpx.AsyncClient(
+        transport=TracingTransport(httpx.MockTransport(lambda request: httpx.Response(200, json={})), "google")
+    )
+
+    @app.get("/slow")
+    async def slow(request: Request):
+        with span("auth.verify_token"):
+            await fake_redis_call()
+        await provider_client.get("https://oauth2.googleapis.com/token")
+        await asyncio.sleep(0.02)
+        return {"trace_id": request.state.trace.trace_id}
+
+    @app.get("/fast")
+    async def fast():
+        return {}
+
+    return app
+
+
+def test_slow_request_is_exported_with_nested_spans():
+    collector = InMemoryCollector()
+    client = TestClient(_create_app(Tracer(collector, slow_threshold=0.01, sample_rate=0)))
+
+    trace_id = client.get("/slow").json()["trace_id"]
+
+    assert len(collector.traces) == 1
+    trace = collector.traces[0]
+    assert trace["trace_id"] == trace_id
+    spans = {span["name"]: span for span in trace["spans"]}
+    assert spans["redis.get_refresh_token"]["parent_id"] == spans["auth.verify_token"]["span_id"]
+    assert spans["http.google"]["attributes"]["status"] == 200
+    assert spans["response.serialize"]["duration_ms"] is not None
+    assert spans["response.send"]["duration_ms"] is not None
+
+
+def test_fast_request_is_dropped_by_tail_sampling():
+    collector = InMemoryCollector()
+    client = TestClient(_create_app(Tracer(collector, slow_threshold=10, sample_rate=0)))
+
+    client.get("/fast")
+
+    assert len(collector.traces) == 0
+
+
+def test_span_without_trace_is_noop():
+    with span("background") as current:
+        assert current is None
+
+
+def test_spans_beyond_limit_are_counted_not_kept():
+    trace, tokens = start_trace("GET /loop")
+    trace.max_spans = 10
+    try:
+        for _ in range(100):
+            with span("redis.get"):
+                pass
+    finally:
+        finish_trace(trace, tokens)
+
+    exported = trace.to_dict()
+    assert len(exported["spans"]) == 10
+    assert exported["dropped_spans"] == 91
+
+
+def test_response_send_span_respects_limit(monkeypatch):
+    monkeypatch.setattr(settings, "TRACE_MAX_SPANS", 3)
+    collector = InMemoryCollector()
+    client = TestClient(_create_app(Tracer(collector, slow_threshold=0.01, sample_rate=0)))
+
+    client.get("/slow")
+
+    trace = collector.traces[0]
+    assert len(trace["spans"]) == 3
+    assert "response.send" not in {span["name"] for span in trace["spans"]}
+    assert trace["dropped_spans"] > 0
+
+
+def test_file_collector_rotates_by_size(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    collector = FileCollector(str(path), max_bytes=1024, backup_count=2)
+    for _ in range(50):
+        trace, tokens = start_trace("GET /rotate")
+        finish_trace(trace, tokens)
+        collector.export(trace)
+    collector.close()
+
+    files = sorted(tmp_path.iterdir())
+    assert [file.name for file in files] == ["traces.jsonl", "traces.jsonl.1", "traces.jsonl.2"]
+    assert all(file.stat().st_size <= 1024 for file in files)
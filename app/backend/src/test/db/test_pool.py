@@ -0,0 +1,29 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.main.db.pool import InstrumentedAsyncQueuePool
+
+
+@pytest.mark.asyncio
+async def test_concurrent_checkouts_are_all_measured(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+    )
+
+    async def hold_connection():
+        async with engine.connect():
+            await asyncio.sleep(0.05)
+
+    await asyncio.gather(*(hold_connection() for _ in range(5)))
+    stats = engine.pool.stats()
+    await engine.dispose()
+
+    # 커넥션 하나를 돌려 쓰므로 마지막 체크아웃은 앞의 네 번이 끝날 때까지 대기
+    assert stats["checkouts"] == 5
+    assert stats["timeouts"] == 0
+    assert stats["wait_max"] >= 0.15
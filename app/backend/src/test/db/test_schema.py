@@ -0,0 +1,41 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.main.db.schema import SchemaRevisionError, get_head_revisions, verify_schema_revision
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    yield engine
+    await engine.dispose()
+
+
+async def _stamp(engine, revision: str):
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL PRIMARY KEY)"))
+        await conn.execute(text("INSERT INTO alembic_version (version_num) VALUES (:revision)"), {"revision": revision})
+
+
+@pytest.mark.asyncio
+async def test_head_revision_passes(engine):
+    (head,) = get_head_revisions()
+    await _stamp(engine, head)
+
+    await verify_schema_revision(engine)
+
+
+@pytest.mark.asyncio
+async def test_older_revision_is_rejected(engine):
+    await _stamp(engine, "3f2a9c1d7b40")
+
+    with pytest.raises(SchemaRevisionError, match="3f2a9c1d7b40"):
+        await verify_schema_revision(engine)
+
+
+@pytest.mark.asyncio
+async def test_missing_version_table_is_rejected(engine):
+    with pytest.raises(SchemaRevisionError, match="alembic upgrade head"):
+        await verify_schema_revision(engine)
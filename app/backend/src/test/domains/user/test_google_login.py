@@ -0,0 +1,93 @@
+import time
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from src.main.core.config import settings
+from src.main.domains.user.auth.providers import google
+from src.main.domains.user.auth.providers.google import GoogleLogin
+
+ACCESS_TOKEN = "ya29.access-token"
+USERINFO = {"email": "userinfo@example.com", "name": "userinfo"}
+
+_private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+PRIVATE_PEM = _private_key.private_bytes(
+    serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+).decode()
+PUBLIC_JWK = {
+    **jwk.construct(
+        _private_key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        ).decode(),
+        "RS256",
+    ).to_dict(),
+    "kid": "test-key",
+}
+
+
+def _id_token(access_token: str = ACCESS_TOKEN, **overrides) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": settings.GOOGLE_CLIENT_ID,
+        "sub": "1",
+        "email": "idtoken@example.com",
+        "email_verified": True,
+        "name": "idtoken",
+        "iat": now,
+        "exp": now + 300,
+        **overrides,
+    }
+    return jwt.encode(claims, PRIVATE_PEM, algorithm="RS256", headers={"kid": "test-key"}, access_token=access_token)
+
+
+@pytest.fixture(autouse=True)
+def google_metadata(monkeypatch):
+    monkeypatch.setattr(google.google_metadata, "metadata", {"issuer": "https://accounts.google.com"})
+    monkeypatch.setattr(google.google_metadata, "jwks", {"keys": [PUBLIC_JWK]})
+
+
+def _google_login(id_token: str | None, requests: list) -> GoogleLogin:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.method)
+        if request.method == "POST":
+            token_data = {"access_token": ACCESS_TOKEN, **({"id_token": id_token} if id_token else {})}
+            return httpx.Response(200, json=token_data)
+        return httpx.Response(200, json=USERINFO)
+
+    return GoogleLogin(None, httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("issuer", ["https://accounts.google.com", "accounts.google.com"])
+async def test_verified_id_token_skips_userinfo(issuer):
+    requests = []
+
+    user = await _google_login(_id_token(iss=issuer), requests).get_user_info("code", "state")
+
+    assert user.email == "idtoken@example.com"
+    assert requests == ["POST"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "id_token",
+    [
+        pytest.param(_id_token(aud="other-client"), id="wrong-aud"),
+        pytest.param(_id_token(iss="https://evil.example.com"), id="wrong-iss"),
+        pytest.param(_id_token(access_token="other-access-token"), id="at-hash-mismatch"),
+        pytest.param(_id_token(exp=int(time.time()) - 60), id="expired"),
+        pytest.param("not-a-jwt", id="invalid"),
+        pytest.param(None, id="missing"),
+    ],
+)
+async def test_unverifiable_id_token_falls_back_to_userinfo(id_token):
+    requests = []
+
+    user = await _google_login(id_token, requests).get_user_info("code", "state")
+
+    assert user.email == "userinfo@example.com"
+    assert requests == ["POST", "GET"]
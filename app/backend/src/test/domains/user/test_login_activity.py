@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from fakeredis.aioredis import FakeRedis
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.main.db.database import Base
+from src.main.domains.user.models.login_event import LoginEvent
+from src.main.domains.user.models.user import User
+from src.main.domains.user.repository.login_activity import LoginActivityBuffer
+from src.main.domains.user.repository.user_cache import UserCache
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        session.add_all([User(id=1, email="a@example.com", name="a"), User(id=2, email="b@example.com", name="b")])
+        await session.commit()
+    yield factory
+    await engine.dispose()
+
+
+@pytest.fixture
+def cache():
+    return UserCache(FakeRedis(), ttl=60, local_ttl=5, maxsize=100)
+
+
+def _buffer(session_factory, cache, **kwargs) -> LoginActivityBuffer:
+    options = {"maxsize": 100, "batch_size": 2, "flush_interval": 60, **kwargs}
+    return LoginActivityBuffer(session_factory, cache=cache, **options)
+
+
+async def _event_count(session_factory) -> int:
+    async with session_factory() as session:
+        return await session.scalar(select(func.count()).select_from(LoginEvent))
+
+
+async def _last_login(session_factory, user_id: int) -> datetime | None:
+    async with session_factory() as session:
+        user = await session.get(User, user_id)
+    return user.last_login.replace(tzinfo=None) if user.last_login else None
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_all_batches_and_keeps_latest_last_login(session_factory, cache):
+    buffer = _buffer(session_factory, cache)
+    buffer.record(1, "login", "google")
+    after_first = datetime.now(timezone.utc).replace(tzinfo=None)
+    buffer.record(1, "login", "google")
+    buffer.record(1, "login", "google")
+    buffer.record(2, "refresh")
+
+    await buffer.flush()
+
+    assert await _event_count(session_factory) == 4
+    # 같은 유저의 기록은 가장 마지막 시각 하나로 합쳐 갱신
+    assert await _last_login(session_factory, 1) >= after_first
+
+
+@pytest.mark.asyncio
+async def test_delayed_flush_does_not_overwrite_newer_last_login(session_factory, cache):
+    buffer = _buffer(session_factory, cache)
+    buffer.record(1, "login", "google")
+    newer = datetime.now(timezone.utc) + timedelta(minutes=1)
+    async with session_factory() as session:
+        (await session.get(User, 1)).last_login = newer
+        await session.commit()
+
+    await buffer.flush()
+
+    assert await _last_login(session_factory, 1) == newer.replace(tzinfo=None)
+    assert await _event_count(session_factory) == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_invalidates_updated_users_cache(session_factory, cache):
+    async with session_factory() as session:
+        await cache.set(await session.get(User, 1))
+    buffer = _buffer(session_factory, cache)
+    buffer.record(1, "login", "google")
+    buffer.record(2, "login", "kakao", update_last_login=False)
+
+    await buffer.flush()
+
+    assert await cache.get("id", 1) is None
+    assert await cache.get("email", "a@example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_then_dropped(session_factory, cache):
+    failures = {"remaining": 2}
+
+    def flaky_factory():
+        if failures["remaining"]:
+            failures["remaining"] -= 1
+            raise ConnectionError("db down")
+        return session_factory()
+
+    buffer = _buffer(flaky_factory, cache, max_retries=1)
+    buffer.record(1, "login", "google")
+
+    # 첫 실패는 다시 큐에 넣고, 두 번째 실패에서 버림
+    await buffer.flush()
+    assert buffer._queue.qsize() == 1 and buffer.dropped == 0
+    await buffer.flush()
+    assert buffer._queue.qsize() == 0 and buffer.dropped == 1
+
+    buffer.record(1, "login", "google")
+    await buffer.flush()
+    assert await _event_count(session_factory) == 1
+    assert buffer.dropped == 1
@@ -0,0 +1,108 @@
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from src.main.core.metrics import REDIS_COMMAND_SECONDS
+from src.main.domains.user.repository.revocation_filter import LEGACY_BLACKLIST_KEY, RevocationFilter
+from src.main.domains.user.repository.token_repository import TokenRepository
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def token_repository(redis):
+    return TokenRepository(redis, RevocationFilter(redis, capacity=1000, error_rate=0.01, rebuild_interval=300))
+
+
+@pytest.mark.asyncio
+async def test_legacy_blacklist_is_checked_until_migrated(redis, token_repository):
+    await redis.sadd(LEGACY_BLACKLIST_KEY, "legacy-token")
+    revocation_filter = token_repository.revocation_filter
+
+    # 필터 준비 전과 재구성 후 모두 레거시 Set에 남은 토큰을 거부
+    assert await token_repository.is_token_blacklisted("legacy-token")
+    await revocation_filter.rebuild()
+    revocation_filter.ready = True
+    assert revocation_filter.legacy_blacklist
+    assert await token_repository.is_token_blacklisted("legacy-token")
+    assert not await token_repository.is_token_blacklisted("other-token")
+
+    await token_repository.migrate_legacy_blacklist()
+    await revocation_filter.rebuild()
+    assert not revocation_filter.legacy_blacklist
+    assert await token_repository.is_token_blacklisted("legacy-token")
+
+
+async def _rotate(token_repository, old_token: str, new_token: str, grace_seconds: int = 10):
+    return await token_repository.rotate_refresh_token("1", old_token, new_token, 3600, grace_seconds)
+
+
+@pytest.mark.asyncio
+async def test_rotation_and_reuse_within_grace(token_repository):
+    await token_repository.store_refresh_token("1", "old", 3600)
+
+    status, token = await _rotate(token_repository, "old", "new")
+    assert (status.value, token) == ("rotated", "new")
+    assert await token_repository.get_refresh_token("1") == "new"
+
+    # 동시 요청이 같은 이전 토큰으로 들어오면 이미 발급된 새 토큰을 받음
+    status, token = await _rotate(token_repository, "old", "newer")
+    assert (status.value, token) == ("reused", "new")
+
+
+@pytest.mark.asyncio
+async def test_unknown_token_is_rejected(token_repository):
+    await token_repository.store_refresh_token("1", "current", 3600)
+
+    status, token = await _rotate(token_repository, "stolen", "new")
+
+    assert (status.value, token) == ("mismatch", None)
+    assert await token_repository.get_refresh_token("1") == "current"
+
+
+@pytest.mark.asyncio
+async def test_rotation_without_grace_period(token_repository):
+    await token_repository.store_refresh_token("1", "old", 3600)
+
+    status, _ = await _rotate(token_repository, "old", "new", grace_seconds=0)
+    assert status.value == "rotated"
+
+    status, _ = await _rotate(token_repository, "old", "newer", grace_seconds=0)
+    assert status.value == "mismatch"
+
+
+@pytest.mark.asyncio
+async def test_logout_and_revoke_all_end_grace_period(token_repository):
+    await token_repository.store_refresh_token("1", "old", 3600)
+    await _rotate(token_repository, "old", "new")
+    await token_repository.delete_refresh_token("1")
+    status, _ = await _rotate(token_repository, "old", "newer")
+    assert status.value == "mismatch"
+
+    await token_repository.store_refresh_token("1", "old", 3600)
+    await _rotate(token_repository, "old", "new")
+    await token_repository.revoke_all_tokens("1")
+    status, _ = await _rotate(token_repository, "old", "newer")
+    assert status.value == "mismatch"
+
+
+def _observed_count(child) -> int:
+    return sum(child.counts)
+
+
+@pytest.mark.asyncio
+async def test_local_answers_are_not_recorded_as_redis_latency(token_repository):
+    blacklist = REDIS_COMMAND_SECONDS.labels("is_token_blacklisted")
+    generation = REDIS_COMMAND_SECONDS.labels("get_token_generation")
+    token_repository.revocation_filter.ready = True
+    token_repository.revocation_filter.legacy_blacklist = False
+    before = (_observed_count(blacklist), _observed_count(generation))
+
+    # Bloom 필터 음성 판정과 세대 캐시 적중은 Redis를 호출하지 않음
+    assert not await token_repository.is_token_blacklisted("unknown-token")
+    assert await token_repository.get_token_generation("1") == 0
+    assert not await token_repository.is_generation_revoked({"uid": "1", "gen": 0})
+
+    assert (_observed_count(blacklist), _observed_count(generation)) == (before[0], before[1] + 1)
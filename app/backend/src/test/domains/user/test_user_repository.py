@@ -0,0 +1,129 @@
+import pytest
+import pytest_asyncio
+from fakeredis.aioredis import FakeRedis
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.main.core.metrics import DB_QUERY_SECONDS
+from src.main.db.database import Base
+from src.main.db.deps import RequestSession
+from src.main.db.routing import RoutingSession
+from src.main.domains.user.models.user import User
+from src.main.domains.user.repository.user_cache import UserCache
+from src.main.domains.user.repository.user_repository import UserRepository
+
+
+class StubReplicaSet:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def choose(self):
+        return self.engine
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def cache():
+    return UserCache(FakeRedis(), ttl=60, local_ttl=5, maxsize=100)
+
+
+def _session_factory(engine, session_class=RoutingSession):
+    return sessionmaker(engine, class_=AsyncSession, sync_session_class=session_class, expire_on_commit=False)
+
+
+async def _create_user(engine, cache) -> User:
+    request_session = RequestSession(_session_factory(engine))
+    user = await UserRepository(request_session.get(), cache).create_user(
+        {"email": "user@example.com", "name": "user", "password": "hashed"}
+    )
+    await request_session.commit()
+    await request_session.close()
+    return user
+
+
+async def _read(engine, cache, field: str, value, session_class=RoutingSession) -> User | None:
+    async with _session_factory(engine, session_class)() as db:
+        repository = UserRepository(db, cache)
+        return await (repository.get_by_id(value) if field == "id" else repository.get_by_email(value))
+
+
+async def _cached_keys(cache: UserCache) -> list[bytes]:
+    return await cache.redis_client.keys("user_cache:*")
+
+
+@pytest.mark.asyncio
+async def test_cache_is_invalidated_only_after_commit(engine, cache):
+    user = await _create_user(engine, cache)
+    await _read(engine, cache, "id", user.id)
+    assert len(await _cached_keys(cache)) == 2
+
+    request_session = RequestSession(_session_factory(engine))
+    await UserRepository(request_session.get(), cache).upsert_user({"email": user.email, "name": "user"})
+    # 커밋 전에는 다른 요청이 보는 캐시를 건드리지 않음
+    assert len(await _cached_keys(cache)) == 2
+
+    await request_session.commit()
+    await request_session.close()
+    assert await _cached_keys(cache) == []
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_write_does_not_invalidate(engine, cache):
+    user = await _create_user(engine, cache)
+    await _read(engine, cache, "id", user.id)
+
+    request_session = RequestSession(_session_factory(engine))
+    await UserRepository(request_session.get(), cache).upsert_user({"email": user.email, "name": "user"})
+    await request_session.rollback()
+    await request_session.close()
+
+    assert len(await _cached_keys(cache)) == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_user_excludes_password(engine, cache):
+    user = await _create_user(engine, cache)
+    await _read(engine, cache, "email", user.email)
+
+    data = await cache.get("email", user.email)
+
+    assert data["email"] == user.email
+    assert "password" not in data
+
+
+@pytest.mark.asyncio
+async def test_replica_reads_fill_cache_with_short_ttl(engine):
+    cache = UserCache(FakeRedis(), ttl=60, local_ttl=5, maxsize=100, replica_ttl=2)
+    user = await _create_user(engine, cache)
+
+    class ReplicaRoutedSession(RoutingSession):
+        replica_set = StubReplicaSet(engine)
+
+    found = await _read(engine, cache, "id", user.id, ReplicaRoutedSession)
+
+    assert found.email == user.email
+    # 복제 지연 한도(replica_ttl)만큼만 보관
+    assert 0 < await cache.redis_client.ttl(f"user_cache:id:{user.id}") <= 2
+    assert (await _read(engine, cache, "email", user.email, ReplicaRoutedSession)).id == user.id
+    assert cache.local.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_are_not_recorded_as_query_latency(engine, cache):
+    user = await _create_user(engine, cache)
+    select_seconds = DB_QUERY_SECONDS.labels("get_by_id")
+    before = sum(select_seconds.counts)
+
+    await _read(engine, cache, "id", user.id)
+    await _read(engine, cache, "id", user.id)
+
+    # 두 번째 조회는 캐시에서 답하므로 SELECT 한 번만 기록
+    assert sum(select_seconds.counts) == before + 1